@@ -15,6 +15,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
+import orjson
 import os
 
 Base = declarative_base()
@@ -103,7 +104,14 @@ db_path = os.path.join(current_dir, "partselect.db")
 os.makedirs(current_dir, exist_ok=True)
 
 # Database setup
-engine = create_engine(f"sqlite:///{db_path}", echo=False)
+# JSON columns (installation_steps, common_symptoms) go through orjson instead
+# of the stdlib json module
+engine = create_engine(
+    f"sqlite:///{db_path}",
+    echo=False,
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),
+    json_deserializer=orjson.loads,
+)
 SessionLocal = sessionmaker(bind=engine)
 
 
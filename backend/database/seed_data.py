@@ -2,19 +2,193 @@
 Seed database with scraped parts data
 """
 
-import json
 import os
+import queue
 import sys
+import threading
+from typing import Tuple
+
+import ijson
 
 # Add parent directory to path
 current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
 sys.path.insert(0, parent_dir)
 
-from database.models import init_db, SessionLocal, Part, Model, Base, engine
+from sqlalchemy import func, or_, select, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from database.models import (
+    init_db,
+    Part,
+    Model,
+    Base,
+    engine,
+    part_model_compatibility,
+)
+
+BATCH_SIZE = 1000
+
+# Part columns refreshed from the file when the part number already exists
+PART_FIELDS = tuple(
+    column.name
+    for column in Part.__table__.columns
+    if column.name not in ("id", "part_number")
+)
+
 
+def chunked(iterable, size):
+    """Yield lists of up to `size` items from an iterable"""
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def produce_batches(
+    parts_file: str, batches: queue.Queue, batch_size: int = BATCH_SIZE
+):
+    """Parse the parts file incrementally and feed batches to the seeder"""
+    try:
+        with open(parts_file, "rb") as f:
+            items = ijson.items(f, "item", use_float=True)
+            for batch in chunked(items, batch_size):
+                batches.put(batch)
+    except Exception as e:
+        # Hand parse errors to the consumer so they are raised there
+        batches.put(e)
+    finally:
+        batches.put(None)
 
-def seed_database():
+
+def insert_batch(conn, parts_batch, seen_models: set) -> Tuple[int, int, int]:
+    """Upsert one batch of parts and insert their new models and links.
+
+    Returns the numbers of parts added or changed, and of new models and
+    part/model links added.
+    """
+    # Build plain row dicts up front so everything goes in via Core
+    # executemany instead of per-object ORM flushes
+    parts_rows = []
+    models_rows = []
+    links = []
+
+    for part_data in parts_batch:
+        part_number = part_data["part_number"]
+        parts_rows.append(
+            {
+                "part_number": part_number,
+                "name": part_data["name"],
+                "category": part_data["category"],
+                "subcategory": part_data.get("subcategory"),
+                "price": part_data["price"],
+                "description": part_data["description"],
+                "brand": part_data["brand"],
+                "image_url": part_data.get("image_url"),
+                "installation_difficulty": part_data.get("installation_difficulty"),
+                "installation_steps": part_data.get("installation_steps", []),
+                "common_symptoms": part_data.get("common_symptoms", []),
+            }
+        )
+
+        # Add compatible models
+        brand = part_data["brand"]
+        appliance_type = part_data["category"]
+        for model_number in part_data.get("compatible_models", []):
+            if model_number not in seen_models:
+                seen_models.add(model_number)
+                models_rows.append(
+                    {
+                        "model_number": model_number,
+                        "brand": brand,
+                        "appliance_type": appliance_type,
+                    }
+                )
+            links.append((part_number, model_number))
+
+    # Existing parts take the file's values, so the table tracks the data
+    # file the same way the vector store's upsert does. Rows whose fields
+    # are all unchanged are skipped, so rowcount only counts real changes
+    part_insert = sqlite_insert(Part.__table__)
+    excluded = part_insert.excluded
+    parts_changed = conn.execute(
+        part_insert.on_conflict_do_update(
+            index_elements=["part_number"],
+            set_={name: excluded[name] for name in PART_FIELDS},
+            where=or_(
+                *(
+                    Part.__table__.c[name].is_distinct_from(excluded[name])
+                    for name in PART_FIELDS
+                )
+            ),
+        ),
+        parts_rows,
+    ).rowcount
+
+    # Models carry nothing that changes between runs, so existing ones
+    # are left alone
+    models_added = 0
+    if models_rows:
+        models_added = conn.execute(
+            sqlite_insert(Model.__table__).on_conflict_do_nothing(
+                index_elements=["model_number"]
+            ),
+            models_rows,
+        ).rowcount
+
+    if not links:
+        return parts_changed, models_added, 0
+
+    # The association table has no unique constraint, so skip the links
+    # that are already present
+    part_ids = dict(
+        conn.execute(
+            select(Part.part_number, Part.id).where(
+                Part.part_number.in_([row["part_number"] for row in parts_rows])
+            )
+        ).all()
+    )
+    model_ids = dict(
+        conn.execute(
+            select(Model.model_number, Model.id).where(
+                Model.model_number.in_({model_number for _, model_number in links})
+            )
+        ).all()
+    )
+    seen_links = {
+        tuple(row)
+        for row in conn.execute(
+            select(
+                part_model_compatibility.c.part_id,
+                part_model_compatibility.c.model_id,
+            ).where(part_model_compatibility.c.part_id.in_(list(part_ids.values())))
+        )
+    }
+
+    links_rows = []
+    for part_number, model_number in links:
+        key = (part_ids[part_number], model_ids[model_number])
+        if key not in seen_links:
+            seen_links.add(key)
+            links_rows.append({"part_id": key[0], "model_id": key[1]})
+
+    if links_rows:
+        conn.execute(part_model_compatibility.insert(), links_rows)
+
+    return parts_changed, models_added, len(links_rows)
+
+
+def seed_database(rebuild: bool = False):
+    """Load parts_data.json into the database.
+
+    Parts are upserted into the existing tables; pass `rebuild=True`
+    (or --rebuild on the command line) to clear them first, which also
+    drops parts that are no longer in the file.
+    """
     print("=" * 80)
     print("Starting database seeding...")
     print("=" * 80 + "\n")
@@ -33,107 +207,90 @@ def seed_database():
         print("  Please run the scraper first: python scripts/scrape_partselect.py")
         return
 
-    with open(parts_file, "r") as f:
-        parts_data = json.load(f)
-
-    print(f"Step 2: Loaded {len(parts_data)} parts from {parts_file}\n")
-
-    db = SessionLocal()
+    # Parse on a background thread so JSON decoding overlaps with the inserts
+    print(f"Step 2: Streaming parts from {parts_file}\n")
+    batches = queue.Queue(maxsize=4)
+    producer = threading.Thread(
+        target=produce_batches, args=(parts_file, batches), daemon=True
+    )
+    producer.start()
 
-    try:
-        # Check if tables exist and have data
-        print("Step 3: Clearing existing data...")
+    # A bare connection skips the ORM session's identity map and autoflush
+    # bookkeeping; AUTOCOMMIT lets us issue a single BEGIN/COMMIT ourselves
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
         try:
-            part_count = db.query(Part).count()
-            model_count = db.query(Model).count()
-            print(f"  Found {part_count} existing parts")
-            print(f"  Found {model_count} existing models")
-
-            if part_count > 0 or model_count > 0:
-                db.query(Part).delete()
-                db.query(Model).delete()
-                db.commit()
-                print("  ✓ Existing data cleared")
-        except Exception as e:
-            print(f"  No existing data to clear (this is fine for first run)")
-            db.rollback()
-
-        print()
-
-        # Track unique models
-        models_dict = {}
-
-        print("Step 4: Adding parts and models to database...")
-
-        # Add parts and models
-        for idx, part_data in enumerate(parts_data):
-            # Create Part
-            part = Part(
-                part_number=part_data["part_number"],
-                name=part_data["name"],
-                category=part_data["category"],
-                subcategory=part_data.get("subcategory"),
-                price=part_data["price"],
-                description=part_data["description"],
-                brand=part_data["brand"],
-                image_url=part_data.get("image_url"),
-                installation_difficulty=part_data.get("installation_difficulty"),
-                installation_steps=part_data.get("installation_steps", []),
-                common_symptoms=part_data.get("common_symptoms", []),
-            )
+            print("Step 3: Adding parts and models to database...")
 
-            # Add compatible models
-            for model_number in part_data.get("compatible_models", []):
-                if model_number not in models_dict:
-                    model = Model(
-                        model_number=model_number,
-                        brand=part_data["brand"],
-                        appliance_type=part_data["category"],
-                    )
-                    models_dict[model_number] = model
-                    db.add(model)
+            part_total = 0
+            parts_changed = 0
+            models_added = 0
+            links_added = 0
+            seen_models = set()
 
-                part.compatible_models.append(models_dict[model_number])
+            conn.execute(text("BEGIN"))
 
-            db.add(part)
+            # Cleared inside the transaction, so a failed load keeps the old data
+            if rebuild:
+                conn.execute(part_model_compatibility.delete())
+                conn.execute(Part.__table__.delete())
+                conn.execute(Model.__table__.delete())
+                print("  ✓ Existing data cleared")
 
-            if (idx + 1) % 2 == 0 or (idx + 1) == len(parts_data):
-                print(f"  Processed {idx + 1}/{len(parts_data)} parts...")
+            while (batch := batches.get()) is not None:
+                if isinstance(batch, Exception):
+                    raise batch
 
-        db.commit()
+                batch_parts, batch_models, batch_links = insert_batch(
+                    conn, batch, seen_models
+                )
+                parts_changed += batch_parts
+                models_added += batch_models
+                links_added += batch_links
+                part_total += len(batch)
+                print(f"  Processed {part_total} parts...")
 
-        print("\n" + "=" * 80)
-        print(f"✓ SUCCESS! Database seeded with {len(parts_data)} parts!")
-        print(f"✓ Added {len(models_dict)} unique models!")
-        print("=" * 80 + "\n")
+            conn.execute(text("COMMIT"))
 
-        # Verify data
-        print("Step 5: Verifying database...")
-        part_count = db.query(Part).count()
-        model_count = db.query(Model).count()
-        print(f"  ✓ Parts in database: {part_count}")
-        print(f"  ✓ Models in database: {model_count}\n")
+            print("\n" + "=" * 80)
+            print(f"✓ SUCCESS! Read {part_total} parts from file!")
+            print(f"✓ Added or updated {parts_changed} parts!")
+            print(f"✓ Added {models_added} new models!")
+            print(f"✓ Added {links_added} new part/model links!")
+            print("=" * 80 + "\n")
 
-        # Show sample parts
-        print("Sample parts:")
-        sample_parts = db.query(Part).limit(3).all()
-        for part in sample_parts:
-            print(f"  - {part.name} ({part.part_number}) - ${part.price}")
+            # Verify data
+            print("Step 4: Verifying database...")
+            part_count = conn.execute(
+                select(func.count()).select_from(Part.__table__)
+            ).scalar()
+            model_count = conn.execute(
+                select(func.count()).select_from(Model.__table__)
+            ).scalar()
+            print(f"  ✓ Parts in database: {part_count}")
+            print(f"  ✓ Models in database: {model_count}\n")
 
-        print("\n" + "=" * 80)
-        print("✓ Database is ready to use!")
-        print("=" * 80)
+            # Show sample parts
+            print("Sample parts:")
+            # Only the printed columns, so the JSON columns are never decoded
+            sample_parts = conn.execute(
+                select(Part.name, Part.part_number, Part.price).limit(3)
+            ).all()
+            for name, part_number, price in sample_parts:
+                print(f"  - {name} ({part_number}) - ${price}")
 
-    except Exception as e:
-        print(f"\n✗ Error seeding database: {e}")
-        import traceback
+            print("\n" + "=" * 80)
+            print("✓ Database is ready to use!")
+            print("=" * 80)
 
-        traceback.print_exc()
-        db.rollback()
-        raise
-    finally:
-        db.close()
+        except Exception as e:
+            print(f"\n✗ Error seeding database: {e}")
+            import traceback
+
+            traceback.print_exc()
+            if conn.connection.dbapi_connection.in_transaction:
+                conn.execute(text("ROLLBACK"))
+            raise
 
 
 if __name__ == "__main__":
-    seed_database()
+    seed_database(rebuild="--rebuild" in sys.argv)
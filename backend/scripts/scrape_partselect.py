@@ -4,1043 +4,1058 @@ Generate 100 Realistic PartSelect Parts
 Run: python generate_100_parts.py
 """
 
-import json
 import random
+from dataclasses import dataclass
 
+import orjson
 
-def generate_part_number():
-    """Generate realistic part number (PS + 8 digits)"""
-    return f"PS{random.randint(10000000, 99999999)}"
-
-
-def select_models(count=4):
-    """Select random compatible models"""
-    models = [
-        "WRF555SDFZ",
-        "WRS325SDHZ",
-        "WRS588FIHZ",
-        "MFI2570FEZ",
-        "GSS25GSHSS",
-        "KSF26C6XYY",
-        "WDT780SAEM1",
-        "LFXS26973S",
-        "RF28R7351SR",
-        "FFHS2622MS",
-        "GNE27JSMSS",
-        "WRX735SDHZ",
-        "KRFF507HPS",
-        "KRMF706ESS",
-        "PFE28KSKSS",
-        "FGHB2868TF",
-    ]
-    return random.sample(models, min(count, len(models)))
-
-
-def create_refrigerator_parts():
-    """Generate 50 refrigerator parts"""
-    parts = []
-    brands = ["Whirlpool", "GE", "KitchenAid", "Samsung", "LG", "Frigidaire", "Maytag"]
-
-    # Ice Maker Parts (8 parts)
-    ice_maker_parts = [
-        (
-            "Ice Maker Assembly",
-            124.99,
-            "Complete ice maker assembly with motor, mold, and heating element",
-            "Easy",
-        ),
-        (
-            "Ice Maker Mold and Heater",
-            59.99,
-            "Ice mold tray with integrated heating element for releasing ice cubes",
-            "Moderate",
-        ),
-        (
-            "Ice Dispenser Auger Motor",
-            79.99,
-            "Motor that turns auger to dispense ice from bin",
-            "Moderate",
-        ),
-        (
-            "Ice Level Control Board",
-            98.99,
-            "Electronic control board that monitors ice level and controls production",
-            "Moderate",
-        ),
-        (
-            "Ice Maker Fill Tube",
-            22.99,
-            "Water fill tube that delivers water to ice maker mold",
-            "Easy",
-        ),
-        (
-            "Ice Bin Assembly",
-            44.99,
-            "Complete ice storage bin with auger and housing",
-            "Easy",
-        ),
-        (
-            "Ice Crusher Blade",
-            32.99,
-            "Blade assembly that crushes ice cubes for crushed ice dispensing",
-            "Moderate",
-        ),
-        (
-            "Ice Maker Water Valve",
-            52.99,
-            "Dedicated valve controlling water flow to ice maker",
-            "Moderate",
-        ),
-    ]
-
-    for name, price, desc, diff in ice_maker_parts:
-        parts.append(
-            {
-                "part_number": generate_part_number(),
-                "name": f"Refrigerator {name}",
-                "category": "Refrigerator",
-                "subcategory": "Ice Maker",
-                "price": price,
-                "description": desc,
-                "compatible_models": select_models(),
-                "brand": random.choice(brands),
-                "image_url": f"https://www.partselect.com/images/{name.lower().replace(' ', '-')}.jpg",
-                "installation_difficulty": diff,
-                "installation_steps": [
-                    "Disconnect power to refrigerator",
-                    "Turn off water supply if applicable",
-                    "Remove necessary panels or components",
-                    "Disconnect wire harnesses and water lines",
-                    "Remove old part using appropriate tools",
-                    "Install new part ensuring proper alignment",
-                    "Reconnect all electrical connections",
-                    "Reconnect water lines if applicable",
-                    "Reassemble any panels removed",
-                    "Restore power and test operation",
-                ],
-                "common_symptoms": [
-                    f"{name.split()[-1]} not working properly",
-                    f"Ice maker malfunction",
-                    f"Unusual noises from ice maker",
-                    f"Ice production issues",
-                ],
-            }
-        )
+_BRANDS_REFRIG = (
+    "Whirlpool",
+    "GE",
+    "KitchenAid",
+    "Samsung",
+    "LG",
+    "Frigidaire",
+    "Maytag",
+)
+_BRANDS_DW = (
+    "Whirlpool",
+    "GE",
+    "KitchenAid",
+    "Bosch",
+    "Samsung",
+    "LG",
+    "Frigidaire",
+    "Maytag",
+)
+_MODELS_REFRIG = (
+    "WRF555SDFZ",
+    "WRS325SDHZ",
+    "WRS588FIHZ",
+    "MFI2570FEZ",
+    "GSS25GSHSS",
+    "KSF26C6XYY",
+    "WDT780SAEM1",
+    "LFXS26973S",
+    "RF28R7351SR",
+    "FFHS2622MS",
+    "GNE27JSMSS",
+    "WRX735SDHZ",
+    "KRFF507HPS",
+    "KRMF706ESS",
+    "PFE28KSKSS",
+    "FGHB2868TF",
+)
+_MODELS_DW = (
+    "WDT780SAEM1",
+    "KDFE104HPS",
+    "WDF520PADM",
+    "KDTM354ESS",
+    "SHX3AR75UC",
+    "LDT5665ST",
+    "FFCD2418US",
+    "MDB4949SKZ",
+    "DW80R9950US",
+    "WDT750SAKZ",
+    "KDPM354GPS",
+    "GDT695SSJSS",
+)
 
-    # Water System Parts (8 parts)
-    water_parts = [
-        (
-            "Water Inlet Valve",
-            48.99,
-            "Main water inlet valve controlling water flow to ice maker and dispenser",
-            "Moderate",
-        ),
-        (
-            "Water Filter Housing",
-            39.99,
-            "Housing unit that holds water filter cartridge",
-            "Easy",
-        ),
-        (
-            "Water Filter Cartridge",
-            54.99,
-            "Replacement water filter removing contaminants. Replace every 6 months",
-            "Easy",
-        ),
-        (
-            "Water Dispenser Actuator",
-            27.99,
-            "Push paddle activating water dispenser when pressed",
-            "Easy",
-        ),
-        (
-            "Water Reservoir Tank",
-            64.99,
-            "Internal water storage tank keeping chilled water ready",
-            "Moderate",
-        ),
-        (
-            "Water Line Assembly Kit",
-            34.99,
-            "Complete water line kit with tubing, fittings, and connectors",
-            "Moderate",
-        ),
-        (
-            "Water Dispenser Nozzle",
-            19.99,
-            "Dispenser outlet nozzle where water flows out",
-            "Easy",
-        ),
-        (
-            "Water Pressure Regulator",
-            44.99,
-            "Regulates water pressure to prevent component damage",
-            "Moderate",
-        ),
-    ]
-
-    for name, price, desc, diff in water_parts:
-        parts.append(
-            {
-                "part_number": generate_part_number(),
-                "name": f"Refrigerator {name}",
-                "category": "Refrigerator",
-                "subcategory": "Water System",
-                "price": price,
-                "description": desc,
-                "compatible_models": select_models(),
-                "brand": random.choice(brands),
-                "image_url": f"https://www.partselect.com/images/{name.lower().replace(' ', '-')}.jpg",
-                "installation_difficulty": diff,
-                "installation_steps": [
-                    "Turn off water supply to refrigerator",
-                    "Unplug refrigerator from power outlet",
-                    "Access component location",
-                    "Disconnect water lines carefully",
-                    "Disconnect electrical connections if present",
-                    "Remove mounting hardware",
-                    "Install new component",
-                    "Reconnect water lines securely",
-                    "Reconnect electrical connections",
-                    "Test for leaks before final assembly",
-                ],
-                "common_symptoms": [
-                    "Water dispenser not working",
-                    "Water leaking",
-                    "Low water pressure",
-                    "Water quality issues",
-                ],
-            }
-        )
+# Compatible models per part, clamped to the pool size once at import
+_REFRIG_K = min(4, len(_MODELS_REFRIG))
+_DW_K = min(4, len(_MODELS_DW))
 
-    # Cooling System Parts (10 parts)
-    cooling_parts = [
-        (
-            "Evaporator Fan Motor",
-            72.99,
-            "Fan motor circulating cold air throughout refrigerator and freezer",
-            "Moderate",
-        ),
-        (
-            "Condenser Fan Motor",
-            68.99,
-            "Fan motor cooling condenser coils located at bottom rear",
-            "Moderate",
-        ),
-        (
-            "Defrost Heater",
-            36.99,
-            "Heater melting frost off evaporator coils during defrost cycle",
-            "Difficult",
-        ),
-        ("Defrost Timer", 52.99, "Controls automatic defrost cycle timing", "Moderate"),
-        (
-            "Defrost Thermostat",
-            28.99,
-            "Thermostat monitoring temperature during defrost cycle",
-            "Moderate",
-        ),
-        (
-            "Compressor Start Relay",
-            31.99,
-            "Relay helping compressor motor start",
-            "Moderate",
-        ),
-        (
-            "Overload Protector",
-            24.99,
-            "Protects compressor from overheating and electrical overload",
-            "Easy",
-        ),
-        (
-            "Evaporator Coils",
-            189.99,
-            "Coils where refrigerant absorbs heat to cool interior",
-            "Difficult",
-        ),
-        (
-            "Condenser Coils",
-            124.99,
-            "Coils releasing heat absorbed from refrigerator interior",
-            "Moderate",
-        ),
-        ("Fan Blade", 18.99, "Blade attached to fan motor for air circulation", "Easy"),
-    ]
-
-    for name, price, desc, diff in cooling_parts:
-        parts.append(
-            {
-                "part_number": generate_part_number(),
-                "name": f"Refrigerator {name}",
-                "category": "Refrigerator",
-                "subcategory": "Cooling System",
-                "price": price,
-                "description": desc,
-                "compatible_models": select_models(),
-                "brand": random.choice(brands),
-                "image_url": f"https://www.partselect.com/images/{name.lower().replace(' ', '-')}.jpg",
-                "installation_difficulty": diff,
-                "installation_steps": [
-                    "Unplug refrigerator completely",
-                    "Remove food and shelves as needed",
-                    "Access component location",
-                    "Take photos of wire connections",
-                    "Disconnect electrical connections",
-                    "Remove mounting hardware",
-                    "Remove old component carefully",
-                    "Install new component in correct position",
-                    "Secure with mounting hardware",
-                    "Reconnect electrical connections per photos",
-                    "Reassemble and restore power",
-                    "Allow 24 hours for proper cooling",
-                ],
-                "common_symptoms": [
-                    "Refrigerator not cooling",
-                    "Freezer too warm",
-                    "Frost buildup",
-                    "Unusual noises from compressor area",
-                ],
-            }
-        )
+_IMG_BASE = "https://www.partselect.com/images/"
+_IMG_BASE_DW = "https://www.partselect.com/images/dw-"
 
-    # Door Parts (8 parts)
-    door_parts = [
-        (
-            "Door Gasket (Seal)",
-            89.99,
-            "Rubber seal keeping cold air inside refrigerator",
-            "Easy",
-        ),
-        ("Door Handle", 76.99, "External handle for opening refrigerator door", "Easy"),
-        (
-            "Door Hinge",
-            42.99,
-            "Hinge allowing door to open and close smoothly",
-            "Moderate",
-        ),
-        ("Door Shelf Bin", 28.99, "Plastic bin on door for storing items", "Easy"),
-        ("Door Cam", 15.99, "Plastic cam helping door close automatically", "Easy"),
-        ("Door Closer", 34.99, "Mechanism ensuring door closes completely", "Moderate"),
-        (
-            "Door Switch",
-            22.99,
-            "Switch turning off interior light when door closes",
-            "Easy",
-        ),
-        (
-            "Mullion",
-            58.99,
-            "Divider between fresh food and freezer compartments",
-            "Moderate",
-        ),
-    ]
-
-    for name, price, desc, diff in door_parts:
-        parts.append(
-            {
-                "part_number": generate_part_number(),
-                "name": f"Refrigerator {name}",
-                "category": "Refrigerator",
-                "subcategory": "Door Parts",
-                "price": price,
-                "description": desc,
-                "compatible_models": select_models(),
-                "brand": random.choice(brands),
-                "image_url": f"https://www.partselect.com/images/{name.lower().replace(' ', '-')}.jpg",
-                "installation_difficulty": diff,
-                "installation_steps": [
-                    "Open refrigerator door fully",
-                    "Remove any covers or caps as needed",
-                    "Access mounting hardware",
-                    "Remove screws or clips holding part",
-                    "Remove old part carefully",
-                    "Position new part correctly",
-                    "Secure with mounting hardware",
-                    "Replace any covers or caps",
-                    "Test door operation and seal",
-                ],
-                "common_symptoms": [
-                    "Door not closing properly",
-                    "Door sagging",
-                    "Cold air leaking",
-                    "Door component broken or loose",
-                ],
-            }
-        )
+# Shared installation steps and symptoms, one set per subcategory
+_REFRIG_ICE_STEPS = (
+    "Disconnect power to refrigerator",
+    "Turn off water supply if applicable",
+    "Remove necessary panels or components",
+    "Disconnect wire harnesses and water lines",
+    "Remove old part using appropriate tools",
+    "Install new part ensuring proper alignment",
+    "Reconnect all electrical connections",
+    "Reconnect water lines if applicable",
+    "Reassemble any panels removed",
+    "Restore power and test operation",
+)
 
-    # Storage Parts (6 parts)
-    storage_parts = [
-        ("Glass Shelf", 94.99, "Tempered glass shelf for storing food items", "Easy"),
-        ("Crisper Drawer", 58.99, "Drawer keeping fruits and vegetables fresh", "Easy"),
-        (
-            "Meat Drawer",
-            64.99,
-            "Drawer for storing meat at optimal temperature",
-            "Easy",
-        ),
-        ("Drawer Slide Rail", 29.99, "Rail allowing drawer to slide smoothly", "Easy"),
-        ("Shelf Support", 16.99, "Bracket supporting glass shelves", "Easy"),
-        ("Deli Drawer", 52.99, "Drawer for storing deli meats and cheeses", "Easy"),
-    ]
-
-    for name, price, desc, diff in storage_parts:
-        parts.append(
-            {
-                "part_number": generate_part_number(),
-                "name": f"Refrigerator {name}",
-                "category": "Refrigerator",
-                "subcategory": "Storage",
-                "price": price,
-                "description": desc,
-                "compatible_models": select_models(),
-                "brand": random.choice(brands),
-                "image_url": f"https://www.partselect.com/images/{name.lower().replace(' ', '-')}.jpg",
-                "installation_difficulty": diff,
-                "installation_steps": [
-                    "Remove contents from drawer or shelf",
-                    "Fully extend or remove drawer if applicable",
-                    "Lift front edge slightly",
-                    "Pull toward you to remove",
-                    "For new part, align with tracks or supports",
-                    "Slide into position",
-                    "Lower into place",
-                    "Test smooth operation",
-                ],
-                "common_symptoms": [
-                    f"{name} broken or cracked",
-                    "Drawer not sliding properly",
-                    "Shelf support damaged",
-                    "Storage component needs replacement",
-                ],
-            }
-        )
+_REFRIG_ICE_SYMPTOMS = (
+    "Ice maker malfunction",
+    "Unusual noises from ice maker",
+    "Ice production issues",
+)
 
-    # Lighting Parts (4 parts)
-    lighting_parts = [
-        (
-            "LED Light Bulb",
-            24.99,
-            "Energy-efficient LED bulb illuminating refrigerator interior",
-            "Easy",
-        ),
-        ("Light Socket", 18.99, "Socket holding light bulb in place", "Easy"),
-        (
-            "Light Housing",
-            32.99,
-            "Complete housing assembly for interior lighting",
-            "Moderate",
-        ),
-        (
-            "Light Switch",
-            16.99,
-            "Door-activated switch controlling interior lights",
-            "Easy",
-        ),
-    ]
-
-    for name, price, desc, diff in lighting_parts:
-        parts.append(
-            {
-                "part_number": generate_part_number(),
-                "name": f"Refrigerator {name}",
-                "category": "Refrigerator",
-                "subcategory": "Lighting",
-                "price": price,
-                "description": desc,
-                "compatible_models": select_models(),
-                "brand": random.choice(brands),
-                "image_url": f"https://www.partselect.com/images/{name.lower().replace(' ', '-')}.jpg",
-                "installation_difficulty": diff,
-                "installation_steps": [
-                    "Unplug refrigerator or turn off circuit breaker",
-                    "Locate light assembly",
-                    "Remove light cover if present",
-                    "For bulbs: twist counterclockwise to remove",
-                    "For fixtures: disconnect wires and remove screws",
-                    "Install new component",
-                    "Reconnect electrical connections",
-                    "Replace light cover",
-                    "Restore power and test",
-                ],
-                "common_symptoms": [
-                    "Interior light not working",
-                    "Light flickering",
-                    "Dim lighting",
-                    "Light stays on when door closed",
-                ],
-            }
-        )
+_REFRIG_WATER_STEPS = (
+    "Turn off water supply to refrigerator",
+    "Unplug refrigerator from power outlet",
+    "Access component location",
+    "Disconnect water lines carefully",
+    "Disconnect electrical connections if present",
+    "Remove mounting hardware",
+    "Install new component",
+    "Reconnect water lines securely",
+    "Reconnect electrical connections",
+    "Test for leaks before final assembly",
+)
 
-    # Controls Parts (6 parts)
-    controls_parts = [
-        (
-            "Temperature Control Thermostat",
-            46.99,
-            "Thermostat controlling refrigerator temperature",
-            "Moderate",
-        ),
-        (
-            "Electronic Control Board",
-            164.99,
-            "Main circuit board controlling all refrigerator functions",
-            "Difficult",
-        ),
-        (
-            "Dispenser Control Board",
-            128.99,
-            "Control board managing dispenser functions",
-            "Moderate",
-        ),
-        (
-            "Display Control Board",
-            142.99,
-            "User interface display and control panel",
-            "Moderate",
-        ),
-        (
-            "Damper Control",
-            54.99,
-            "Controls airflow between freezer and refrigerator",
-            "Moderate",
-        ),
-        (
-            "Adaptive Defrost Control Board",
-            118.99,
-            "Advanced control monitoring defrost cycles",
-            "Difficult",
-        ),
-    ]
-
-    for name, price, desc, diff in controls_parts:
-        parts.append(
-            {
-                "part_number": generate_part_number(),
-                "name": f"Refrigerator {name}",
-                "category": "Refrigerator",
-                "subcategory": "Controls",
-                "price": price,
-                "description": desc,
-                "compatible_models": select_models(),
-                "brand": random.choice(brands),
-                "image_url": f"https://www.partselect.com/images/{name.lower().replace(' ', '-')}.jpg",
-                "installation_difficulty": diff,
-                "installation_steps": [
-                    "Disconnect power to refrigerator",
-                    "Remove control panel cover",
-                    "Take clear photos of all wire connections",
-                    "Label wires if needed",
-                    "Disconnect wire harnesses from control",
-                    "Remove control board mounting screws",
-                    "Remove old control carefully",
-                    "Install new control in same position",
-                    "Reconnect all wire harnesses per photos",
-                    "Secure with mounting screws",
-                    "Replace control panel cover",
-                    "Restore power and test all functions",
-                ],
-                "common_symptoms": [
-                    "Temperature control not working",
-                    "Display not functioning",
-                    "Refrigerator not responding to settings",
-                    "Error codes displayed",
-                ],
-            }
-        )
+_REFRIG_WATER_SYMPTOMS = (
+    "Water dispenser not working",
+    "Water leaking",
+    "Low water pressure",
+    "Water quality issues",
+)
 
-    return parts
-
-
-def create_dishwasher_parts():
-    """Generate 50 dishwasher parts"""
-    parts = []
-    brands = [
-        "Whirlpool",
-        "GE",
-        "KitchenAid",
-        "Bosch",
-        "Samsung",
-        "LG",
-        "Frigidaire",
-        "Maytag",
-    ]
-    dw_models = [
-        "WDT780SAEM1",
-        "KDFE104HPS",
-        "WDF520PADM",
-        "KDTM354ESS",
-        "SHX3AR75UC",
-        "LDT5665ST",
-        "FFCD2418US",
-        "MDB4949SKZ",
-        "DW80R9950US",
-        "WDT750SAKZ",
-        "KDPM354GPS",
-        "GDT695SSJSS",
-    ]
-
-    def select_dw_models(count=4):
-        return random.sample(dw_models, min(count, len(dw_models)))
-
-    # Wash System Parts (10 parts)
-    wash_parts = [
-        (
-            "Lower Spray Arm",
-            28.99,
-            "Spray arm distributing water to lower rack dishes",
-            "Easy",
-        ),
-        (
-            "Upper Spray Arm",
-            34.99,
-            "Spray arm distributing water to upper rack dishes",
-            "Easy",
-        ),
-        (
-            "Middle Spray Arm",
-            38.99,
-            "Third spray arm for enhanced cleaning in middle zone",
-            "Easy",
-        ),
-        (
-            "Spray Arm Bearing",
-            14.99,
-            "Bearing allowing spray arm to rotate freely",
-            "Easy",
-        ),
-        (
-            "Spray Arm Hub",
-            18.99,
-            "Central hub connecting spray arm to water supply",
-            "Easy",
-        ),
-        (
-            "Wash Impeller",
-            32.99,
-            "Impeller forcing water through spray arms",
-            "Moderate",
-        ),
-        (
-            "Wash Pump Housing",
-            56.99,
-            "Housing containing wash pump components",
-            "Moderate",
-        ),
-        (
-            "Spray Arm Seal",
-            12.99,
-            "Seal preventing water leaks at spray arm connection",
-            "Easy",
-        ),
-        (
-            "Water Distribution Tube",
-            42.99,
-            "Tube distributing water to upper spray arm",
-            "Moderate",
-        ),
-        ("Spray Arm Nut", 8.99, "Nut securing spray arm to mounting post", "Easy"),
-    ]
-
-    for name, price, desc, diff in wash_parts:
-        parts.append(
-            {
-                "part_number": generate_part_number(),
-                "name": f"Dishwasher {name}",
-                "category": "Dishwasher",
-                "subcategory": "Wash System",
-                "price": price,
-                "description": desc,
-                "compatible_models": select_dw_models(),
-                "brand": random.choice(brands),
-                "image_url": f"https://www.partselect.com/images/dw-{name.lower().replace(' ', '-')}.jpg",
-                "installation_difficulty": diff,
-                "installation_steps": [
-                    "Open dishwasher door fully",
-                    "Remove dish racks as needed",
-                    "Access component location",
-                    "Remove old part (twist, lift, or unscrew)",
-                    "Clean mounting area",
-                    "Install new part ensuring proper fit",
-                    "Secure according to type (twist, clip, or screw)",
-                    "Test rotation or operation if applicable",
-                    "Replace dish racks",
-                ],
-                "common_symptoms": [
-                    "Dishes not getting clean",
-                    "Poor water spray",
-                    "Spray arm not rotating",
-                    "Incomplete wash cycle",
-                ],
-            }
-        )
+_REFRIG_COOLING_STEPS = (
+    "Unplug refrigerator completely",
+    "Remove food and shelves as needed",
+    "Access component location",
+    "Take photos of wire connections",
+    "Disconnect electrical connections",
+    "Remove mounting hardware",
+    "Remove old component carefully",
+    "Install new component in correct position",
+    "Secure with mounting hardware",
+    "Reconnect electrical connections per photos",
+    "Reassemble and restore power",
+    "Allow 24 hours for proper cooling",
+)
 
-    # Pump Parts (8 parts)
-    pump_parts = [
-        (
-            "Pump and Motor Assembly",
-            189.99,
-            "Complete pump assembly circulating and draining water",
-            "Difficult",
-        ),
-        ("Drain Pump", 78.99, "Pump removing waste water from dishwasher", "Moderate"),
-        (
-            "Circulation Pump",
-            142.99,
-            "Pump circulating water during wash cycle",
-            "Difficult",
-        ),
-        ("Pump Impeller", 24.99, "Rotating blade inside pump moving water", "Moderate"),
-        ("Pump Seal Kit", 18.99, "Seals preventing water leaks from pump", "Moderate"),
-        ("Drain Impeller", 16.99, "Impeller in drain pump removing water", "Moderate"),
-        (
-            "Pump Housing",
-            64.99,
-            "Housing containing pump motor and impeller",
-            "Difficult",
-        ),
-        (
-            "Chopper Blade",
-            19.99,
-            "Blade grinding food particles before draining",
-            "Easy",
-        ),
-    ]
-
-    for name, price, desc, diff in pump_parts:
-        parts.append(
-            {
-                "part_number": generate_part_number(),
-                "name": f"Dishwasher {name}",
-                "category": "Dishwasher",
-                "subcategory": "Pump",
-                "price": price,
-                "description": desc,
-                "compatible_models": select_dw_models(),
-                "brand": random.choice(brands),
-                "image_url": f"https://www.partselect.com/images/dw-{name.lower().replace(' ', '-')}.jpg",
-                "installation_difficulty": diff,
-                "installation_steps": [
-                    "Turn off power to dishwasher",
-                    "Turn off water supply",
-                    "Remove lower access panel",
-                    "Place towels to catch water",
-                    "Disconnect hoses and electrical connections",
-                    "Remove pump mounting hardware",
-                    "Remove old pump or component",
-                    "Install new component",
-                    "Reconnect all connections securely",
-                    "Test for leaks before final assembly",
-                ],
-                "common_symptoms": [
-                    "Dishwasher won't drain",
-                    "Dishwasher won't fill",
-                    "Grinding or humming noise",
-                    "Water standing in bottom",
-                ],
-            }
-        )
+_REFRIG_COOLING_SYMPTOMS = (
+    "Refrigerator not cooling",
+    "Freezer too warm",
+    "Frost buildup",
+    "Unusual noises from compressor area",
+)
 
-    # Door Parts (8 parts)
-    door_parts = [
-        (
-            "Door Latch Assembly",
-            54.99,
-            "Latch keeping door closed and activating door switch",
-            "Moderate",
-        ),
-        ("Door Gasket", 41.99, "Seal preventing water leaks from door", "Easy"),
-        (
-            "Door Handle",
-            38.99,
-            "Handle for opening and closing dishwasher door",
-            "Easy",
-        ),
-        ("Door Hinge", 32.99, "Hinge allowing door to open and close", "Moderate"),
-        ("Door Spring", 22.99, "Spring assisting door opening and closing", "Moderate"),
-        ("Door Strike", 15.99, "Strike plate door latch engages with", "Easy"),
-        ("Door Cable", 28.99, "Cable connecting door to spring mechanism", "Moderate"),
-        (
-            "Door Balance Link Kit",
-            34.99,
-            "Kit balancing door weight for smooth operation",
-            "Moderate",
-        ),
-    ]
-
-    for name, price, desc, diff in door_parts:
-        parts.append(
-            {
-                "part_number": generate_part_number(),
-                "name": f"Dishwasher {name}",
-                "category": "Dishwasher",
-                "subcategory": "Door Parts",
-                "price": price,
-                "description": desc,
-                "compatible_models": select_dw_models(),
-                "brand": random.choice(brands),
-                "image_url": f"https://www.partselect.com/images/dw-{name.lower().replace(' ', '-')}.jpg",
-                "installation_difficulty": diff,
-                "installation_steps": [
-                    "Turn off power to dishwasher",
-                    "Open door carefully",
-                    "Remove inner door panel screws",
-                    "Separate inner panel from outer door",
-                    "Disconnect wire harness if present",
-                    "Remove old component",
-                    "Install new component",
-                    "Reconnect electrical connections",
-                    "Reassemble door panel",
-                    "Test door operation",
-                ],
-                "common_symptoms": [
-                    "Door won't stay closed",
-                    "Door won't latch",
-                    "Water leaking from door",
-                    "Door difficult to open or close",
-                ],
-            }
-        )
+_REFRIG_DOOR_STEPS = (
+    "Open refrigerator door fully",
+    "Remove any covers or caps as needed",
+    "Access mounting hardware",
+    "Remove screws or clips holding part",
+    "Remove old part carefully",
+    "Position new part correctly",
+    "Secure with mounting hardware",
+    "Replace any covers or caps",
+    "Test door operation and seal",
+)
 
-    # Heating Parts (6 parts)
-    heating_parts = [
-        (
-            "Heating Element",
-            42.99,
-            "Element heating water during wash and drying dishes",
-            "Moderate",
-        ),
-        (
-            "High Limit Thermostat",
-            24.99,
-            "Safety thermostat preventing overheating",
-            "Moderate",
-        ),
-        (
-            "Thermal Fuse",
-            16.99,
-            "Fuse protecting heating element from overheating",
-            "Easy",
-        ),
-        (
-            "Heating Element Bracket",
-            12.99,
-            "Bracket securing heating element in place",
-            "Easy",
-        ),
-        (
-            "Rinse Aid Heater",
-            38.99,
-            "Small heater warming rinse aid dispenser",
-            "Moderate",
-        ),
-        (
-            "Drying Fan Assembly",
-            68.99,
-            "Fan circulating hot air for faster drying",
-            "Moderate",
-        ),
-    ]
-
-    for name, price, desc, diff in heating_parts:
-        parts.append(
-            {
-                "part_number": generate_part_number(),
-                "name": f"Dishwasher {name}",
-                "category": "Dishwasher",
-                "subcategory": "Heating",
-                "price": price,
-                "description": desc,
-                "compatible_models": select_dw_models(),
-                "brand": random.choice(brands),
-                "image_url": f"https://www.partselect.com/images/dw-{name.lower().replace(' ', '-')}.jpg",
-                "installation_difficulty": diff,
-                "installation_steps": [
-                    "Turn off power completely",
-                    "Remove lower dish rack",
-                    "Remove spray arm if blocking access",
-                    "Locate component at bottom of tub",
-                    "Disconnect wire terminals",
-                    "Remove mounting hardware",
-                    "Remove old component",
-                    "Install new component",
-                    "Reconnect electrical connections",
-                    "Test with multimeter if applicable",
-                    "Reassemble and test",
-                ],
-                "common_symptoms": [
-                    "Dishes not drying",
-                    "Water not heating",
-                    "Dishes still wet after cycle",
-                    "Dishwasher not heating water",
-                ],
-            }
-        )
+_REFRIG_DOOR_SYMPTOMS = (
+    "Door not closing properly",
+    "Door sagging",
+    "Cold air leaking",
+    "Door component broken or loose",
+)
 
-    # Accessories Parts (8 parts)
-    accessories_parts = [
-        ("Silverware Basket", 18.99, "Basket holding utensils during wash", "Easy"),
-        ("Upper Dishrack", 89.99, "Complete upper rack assembly for dishes", "Easy"),
-        ("Lower Dishrack", 124.99, "Complete lower rack assembly for dishes", "Easy"),
-        ("Dishrack Roller", 12.99, "Wheel allowing rack to slide smoothly", "Easy"),
-        ("Rack Adjuster", 16.99, "Mechanism adjusting rack height", "Easy"),
-        ("Tine Row", 24.99, "Row of tines for holding dishes in place", "Easy"),
-        ("Cup Shelf", 28.99, "Flip-down shelf for cups and small items", "Easy"),
-        ("Cutlery Basket", 22.99, "Alternative basket design for utensils", "Easy"),
-    ]
-
-    for name, price, desc, diff in accessories_parts:
-        parts.append(
-            {
-                "part_number": generate_part_number(),
-                "name": f"Dishwasher {name}",
-                "category": "Dishwasher",
-                "subcategory": "Accessories",
-                "price": price,
-                "description": desc,
-                "compatible_models": select_dw_models(),
-                "brand": random.choice(brands),
-                "image_url": f"https://www.partselect.com/images/dw-{name.lower().replace(' ', '-')}.jpg",
-                "installation_difficulty": diff,
-                "installation_steps": [
-                    "Open dishwasher door",
-                    "Remove old component by lifting or sliding",
-                    "For racks: note position and remove from rails",
-                    "For accessories: detach from existing rack",
-                    "Install new component in same position",
-                    "For racks: slide onto rails ensuring smooth glide",
-                    "Test movement and stability",
-                    "Adjust as needed for proper fit",
-                ],
-                "common_symptoms": [
-                    f"{name} broken or damaged",
-                    "Component missing",
-                    "Dishes falling through rack",
-                    "Rack not sliding properly",
-                ],
-            }
-        )
+_REFRIG_STORAGE_STEPS = (
+    "Remove contents from drawer or shelf",
+    "Fully extend or remove drawer if applicable",
+    "Lift front edge slightly",
+    "Pull toward you to remove",
+    "For new part, align with tracks or supports",
+    "Slide into position",
+    "Lower into place",
+    "Test smooth operation",
+)
 
-    # Controls Parts (6 parts)
-    controls_parts = [
-        (
-            "Control Board",
-            164.99,
-            "Main electronic control board managing all functions",
-            "Difficult",
-        ),
-        (
-            "User Interface Control",
-            128.99,
-            "Control panel with buttons and display",
-            "Moderate",
-        ),
-        ("Touchpad", 89.99, "Touch-sensitive control panel", "Moderate"),
-        ("Door Switch", 26.99, "Switch detecting if door is closed", "Easy"),
-        (
-            "Float Switch",
-            32.99,
-            "Switch preventing dishwasher from overfilling",
-            "Moderate",
-        ),
-        (
-            "Pressure Switch",
-            38.99,
-            "Switch detecting water level during cycle",
-            "Moderate",
-        ),
-    ]
-
-    for name, price, desc, diff in controls_parts:
-        parts.append(
-            {
-                "part_number": generate_part_number(),
-                "name": f"Dishwasher {name}",
-                "category": "Dishwasher",
-                "subcategory": "Controls",
-                "price": price,
-                "description": desc,
-                "compatible_models": select_dw_models(),
-                "brand": random.choice(brands),
-                "image_url": f"https://www.partselect.com/images/dw-{name.lower().replace(' ', '-')}.jpg",
-                "installation_difficulty": diff,
-                "installation_steps": [
-                    "Turn off power to dishwasher",
-                    "Remove control panel screws",
-                    "Carefully pull panel forward",
-                    "Take photos of all wire connections",
-                    "Label wires before disconnecting",
-                    "Disconnect wire harnesses from control",
-                    "Remove control mounting screws",
-                    "Install new control",
-                    "Reconnect all wires per photos",
-                    "Secure control with mounting screws",
-                    "Reassemble control panel",
-                    "Restore power and test functions",
-                ],
-                "common_symptoms": [
-                    "Buttons not responding",
-                    "Display not working",
-                    "Dishwasher won't start",
-                    "Cycle not advancing",
-                    "Error codes displayed",
-                ],
-            }
+_REFRIG_STORAGE_SYMPTOMS = (
+    "Drawer not sliding properly",
+    "Shelf support damaged",
+    "Storage component needs replacement",
+)
+
+_REFRIG_LIGHTING_STEPS = (
+    "Unplug refrigerator or turn off circuit breaker",
+    "Locate light assembly",
+    "Remove light cover if present",
+    "For bulbs: twist counterclockwise to remove",
+    "For fixtures: disconnect wires and remove screws",
+    "Install new component",
+    "Reconnect electrical connections",
+    "Replace light cover",
+    "Restore power and test",
+)
+
+_REFRIG_LIGHTING_SYMPTOMS = (
+    "Interior light not working",
+    "Light flickering",
+    "Dim lighting",
+    "Light stays on when door closed",
+)
+
+_REFRIG_CONTROLS_STEPS = (
+    "Disconnect power to refrigerator",
+    "Remove control panel cover",
+    "Take clear photos of all wire connections",
+    "Label wires if needed",
+    "Disconnect wire harnesses from control",
+    "Remove control board mounting screws",
+    "Remove old control carefully",
+    "Install new control in same position",
+    "Reconnect all wire harnesses per photos",
+    "Secure with mounting screws",
+    "Replace control panel cover",
+    "Restore power and test all functions",
+)
+
+_REFRIG_CONTROLS_SYMPTOMS = (
+    "Temperature control not working",
+    "Display not functioning",
+    "Refrigerator not responding to settings",
+    "Error codes displayed",
+)
+
+_DW_WASH_STEPS = (
+    "Open dishwasher door fully",
+    "Remove dish racks as needed",
+    "Access component location",
+    "Remove old part (twist, lift, or unscrew)",
+    "Clean mounting area",
+    "Install new part ensuring proper fit",
+    "Secure according to type (twist, clip, or screw)",
+    "Test rotation or operation if applicable",
+    "Replace dish racks",
+)
+
+_DW_WASH_SYMPTOMS = (
+    "Dishes not getting clean",
+    "Poor water spray",
+    "Spray arm not rotating",
+    "Incomplete wash cycle",
+)
+
+_DW_PUMP_STEPS = (
+    "Turn off power to dishwasher",
+    "Turn off water supply",
+    "Remove lower access panel",
+    "Place towels to catch water",
+    "Disconnect hoses and electrical connections",
+    "Remove pump mounting hardware",
+    "Remove old pump or component",
+    "Install new component",
+    "Reconnect all connections securely",
+    "Test for leaks before final assembly",
+)
+
+_DW_PUMP_SYMPTOMS = (
+    "Dishwasher won't drain",
+    "Dishwasher won't fill",
+    "Grinding or humming noise",
+    "Water standing in bottom",
+)
+
+_DW_DOOR_STEPS = (
+    "Turn off power to dishwasher",
+    "Open door carefully",
+    "Remove inner door panel screws",
+    "Separate inner panel from outer door",
+    "Disconnect wire harness if present",
+    "Remove old component",
+    "Install new component",
+    "Reconnect electrical connections",
+    "Reassemble door panel",
+    "Test door operation",
+)
+
+_DW_DOOR_SYMPTOMS = (
+    "Door won't stay closed",
+    "Door won't latch",
+    "Water leaking from door",
+    "Door difficult to open or close",
+)
+
+_DW_HEATING_STEPS = (
+    "Turn off power completely",
+    "Remove lower dish rack",
+    "Remove spray arm if blocking access",
+    "Locate component at bottom of tub",
+    "Disconnect wire terminals",
+    "Remove mounting hardware",
+    "Remove old component",
+    "Install new component",
+    "Reconnect electrical connections",
+    "Test with multimeter if applicable",
+    "Reassemble and test",
+)
+
+_DW_HEATING_SYMPTOMS = (
+    "Dishes not drying",
+    "Water not heating",
+    "Dishes still wet after cycle",
+    "Dishwasher not heating water",
+)
+
+_DW_ACCESSORIES_STEPS = (
+    "Open dishwasher door",
+    "Remove old component by lifting or sliding",
+    "For racks: note position and remove from rails",
+    "For accessories: detach from existing rack",
+    "Install new component in same position",
+    "For racks: slide onto rails ensuring smooth glide",
+    "Test movement and stability",
+    "Adjust as needed for proper fit",
+)
+
+_DW_ACCESSORIES_SYMPTOMS = (
+    "Component missing",
+    "Dishes falling through rack",
+    "Rack not sliding properly",
+)
+
+_DW_CONTROLS_STEPS = (
+    "Turn off power to dishwasher",
+    "Remove control panel screws",
+    "Carefully pull panel forward",
+    "Take photos of all wire connections",
+    "Label wires before disconnecting",
+    "Disconnect wire harnesses from control",
+    "Remove control mounting screws",
+    "Install new control",
+    "Reconnect all wires per photos",
+    "Secure control with mounting screws",
+    "Reassemble control panel",
+    "Restore power and test functions",
+)
+
+_DW_CONTROLS_SYMPTOMS = (
+    "Buttons not responding",
+    "Display not working",
+    "Dishwasher won't start",
+    "Cycle not advancing",
+    "Error codes displayed",
+)
+
+_DW_WATER_STEPS = (
+    "Turn off power and water supply",
+    "Remove lower access panel or pull dishwasher out",
+    "Place towels to catch water",
+    "Disconnect water line or hose",
+    "Disconnect electrical connection if present",
+    "Remove mounting brackets or clamps",
+    "Remove old component",
+    "Install new component with new clamps",
+    "Reconnect water lines securely",
+    "Reconnect electrical connections",
+    "Turn on water slowly and check for leaks",
+    "Restore power and test",
+)
+
+_DW_WATER_SYMPTOMS = (
+    "Dishwasher won't fill with water",
+    "Water leaking",
+    "Spots on dishes",
+    "Rinse aid not dispensing",
+)
+
+
+# Refrigerator Ice Maker Parts (8 parts)
+_REFRIG_ICE_PARTS = (
+    (
+        "Ice Maker Assembly",
+        124.99,
+        "Complete ice maker assembly with motor, mold, and heating element",
+        "Easy",
+    ),
+    (
+        "Ice Maker Mold and Heater",
+        59.99,
+        "Ice mold tray with integrated heating element for releasing ice cubes",
+        "Moderate",
+    ),
+    (
+        "Ice Dispenser Auger Motor",
+        79.99,
+        "Motor that turns auger to dispense ice from bin",
+        "Moderate",
+    ),
+    (
+        "Ice Level Control Board",
+        98.99,
+        "Electronic control board that monitors ice level and controls production",
+        "Moderate",
+    ),
+    (
+        "Ice Maker Fill Tube",
+        22.99,
+        "Water fill tube that delivers water to ice maker mold",
+        "Easy",
+    ),
+    (
+        "Ice Bin Assembly",
+        44.99,
+        "Complete ice storage bin with auger and housing",
+        "Easy",
+    ),
+    (
+        "Ice Crusher Blade",
+        32.99,
+        "Blade assembly that crushes ice cubes for crushed ice dispensing",
+        "Moderate",
+    ),
+    (
+        "Ice Maker Water Valve",
+        52.99,
+        "Dedicated valve controlling water flow to ice maker",
+        "Moderate",
+    ),
+)
+
+# Refrigerator Water System Parts (8 parts)
+_REFRIG_WATER_PARTS = (
+    (
+        "Water Inlet Valve",
+        48.99,
+        "Main water inlet valve controlling water flow to ice maker and dispenser",
+        "Moderate",
+    ),
+    (
+        "Water Filter Housing",
+        39.99,
+        "Housing unit that holds water filter cartridge",
+        "Easy",
+    ),
+    (
+        "Water Filter Cartridge",
+        54.99,
+        "Replacement water filter removing contaminants. Replace every 6 months",
+        "Easy",
+    ),
+    (
+        "Water Dispenser Actuator",
+        27.99,
+        "Push paddle activating water dispenser when pressed",
+        "Easy",
+    ),
+    (
+        "Water Reservoir Tank",
+        64.99,
+        "Internal water storage tank keeping chilled water ready",
+        "Moderate",
+    ),
+    (
+        "Water Line Assembly Kit",
+        34.99,
+        "Complete water line kit with tubing, fittings, and connectors",
+        "Moderate",
+    ),
+    (
+        "Water Dispenser Nozzle",
+        19.99,
+        "Dispenser outlet nozzle where water flows out",
+        "Easy",
+    ),
+    (
+        "Water Pressure Regulator",
+        44.99,
+        "Regulates water pressure to prevent component damage",
+        "Moderate",
+    ),
+)
+
+# Refrigerator Cooling System Parts (10 parts)
+_REFRIG_COOLING_PARTS = (
+    (
+        "Evaporator Fan Motor",
+        72.99,
+        "Fan motor circulating cold air throughout refrigerator and freezer",
+        "Moderate",
+    ),
+    (
+        "Condenser Fan Motor",
+        68.99,
+        "Fan motor cooling condenser coils located at bottom rear",
+        "Moderate",
+    ),
+    (
+        "Defrost Heater",
+        36.99,
+        "Heater melting frost off evaporator coils during defrost cycle",
+        "Difficult",
+    ),
+    ("Defrost Timer", 52.99, "Controls automatic defrost cycle timing", "Moderate"),
+    (
+        "Defrost Thermostat",
+        28.99,
+        "Thermostat monitoring temperature during defrost cycle",
+        "Moderate",
+    ),
+    (
+        "Compressor Start Relay",
+        31.99,
+        "Relay helping compressor motor start",
+        "Moderate",
+    ),
+    (
+        "Overload Protector",
+        24.99,
+        "Protects compressor from overheating and electrical overload",
+        "Easy",
+    ),
+    (
+        "Evaporator Coils",
+        189.99,
+        "Coils where refrigerant absorbs heat to cool interior",
+        "Difficult",
+    ),
+    (
+        "Condenser Coils",
+        124.99,
+        "Coils releasing heat absorbed from refrigerator interior",
+        "Moderate",
+    ),
+    ("Fan Blade", 18.99, "Blade attached to fan motor for air circulation", "Easy"),
+)
+
+# Refrigerator Door Parts (8 parts)
+_REFRIG_DOOR_PARTS = (
+    (
+        "Door Gasket (Seal)",
+        89.99,
+        "Rubber seal keeping cold air inside refrigerator",
+        "Easy",
+    ),
+    ("Door Handle", 76.99, "External handle for opening refrigerator door", "Easy"),
+    (
+        "Door Hinge",
+        42.99,
+        "Hinge allowing door to open and close smoothly",
+        "Moderate",
+    ),
+    ("Door Shelf Bin", 28.99, "Plastic bin on door for storing items", "Easy"),
+    ("Door Cam", 15.99, "Plastic cam helping door close automatically", "Easy"),
+    ("Door Closer", 34.99, "Mechanism ensuring door closes completely", "Moderate"),
+    (
+        "Door Switch",
+        22.99,
+        "Switch turning off interior light when door closes",
+        "Easy",
+    ),
+    (
+        "Mullion",
+        58.99,
+        "Divider between fresh food and freezer compartments",
+        "Moderate",
+    ),
+)
+
+# Refrigerator Storage Parts (6 parts)
+_REFRIG_STORAGE_PARTS = (
+    ("Glass Shelf", 94.99, "Tempered glass shelf for storing food items", "Easy"),
+    ("Crisper Drawer", 58.99, "Drawer keeping fruits and vegetables fresh", "Easy"),
+    (
+        "Meat Drawer",
+        64.99,
+        "Drawer for storing meat at optimal temperature",
+        "Easy",
+    ),
+    ("Drawer Slide Rail", 29.99, "Rail allowing drawer to slide smoothly", "Easy"),
+    ("Shelf Support", 16.99, "Bracket supporting glass shelves", "Easy"),
+    ("Deli Drawer", 52.99, "Drawer for storing deli meats and cheeses", "Easy"),
+)
+
+# Refrigerator Lighting Parts (4 parts)
+_REFRIG_LIGHTING_PARTS = (
+    (
+        "LED Light Bulb",
+        24.99,
+        "Energy-efficient LED bulb illuminating refrigerator interior",
+        "Easy",
+    ),
+    ("Light Socket", 18.99, "Socket holding light bulb in place", "Easy"),
+    (
+        "Light Housing",
+        32.99,
+        "Complete housing assembly for interior lighting",
+        "Moderate",
+    ),
+    (
+        "Light Switch",
+        16.99,
+        "Door-activated switch controlling interior lights",
+        "Easy",
+    ),
+)
+
+# Refrigerator Controls Parts (6 parts)
+_REFRIG_CONTROLS_PARTS = (
+    (
+        "Temperature Control Thermostat",
+        46.99,
+        "Thermostat controlling refrigerator temperature",
+        "Moderate",
+    ),
+    (
+        "Electronic Control Board",
+        164.99,
+        "Main circuit board controlling all refrigerator functions",
+        "Difficult",
+    ),
+    (
+        "Dispenser Control Board",
+        128.99,
+        "Control board managing dispenser functions",
+        "Moderate",
+    ),
+    (
+        "Display Control Board",
+        142.99,
+        "User interface display and control panel",
+        "Moderate",
+    ),
+    (
+        "Damper Control",
+        54.99,
+        "Controls airflow between freezer and refrigerator",
+        "Moderate",
+    ),
+    (
+        "Adaptive Defrost Control Board",
+        118.99,
+        "Advanced control monitoring defrost cycles",
+        "Difficult",
+    ),
+)
+
+# Dishwasher Wash System Parts (10 parts)
+_DW_WASH_PARTS = (
+    (
+        "Lower Spray Arm",
+        28.99,
+        "Spray arm distributing water to lower rack dishes",
+        "Easy",
+    ),
+    (
+        "Upper Spray Arm",
+        34.99,
+        "Spray arm distributing water to upper rack dishes",
+        "Easy",
+    ),
+    (
+        "Middle Spray Arm",
+        38.99,
+        "Third spray arm for enhanced cleaning in middle zone",
+        "Easy",
+    ),
+    (
+        "Spray Arm Bearing",
+        14.99,
+        "Bearing allowing spray arm to rotate freely",
+        "Easy",
+    ),
+    (
+        "Spray Arm Hub",
+        18.99,
+        "Central hub connecting spray arm to water supply",
+        "Easy",
+    ),
+    (
+        "Wash Impeller",
+        32.99,
+        "Impeller forcing water through spray arms",
+        "Moderate",
+    ),
+    (
+        "Wash Pump Housing",
+        56.99,
+        "Housing containing wash pump components",
+        "Moderate",
+    ),
+    (
+        "Spray Arm Seal",
+        12.99,
+        "Seal preventing water leaks at spray arm connection",
+        "Easy",
+    ),
+    (
+        "Water Distribution Tube",
+        42.99,
+        "Tube distributing water to upper spray arm",
+        "Moderate",
+    ),
+    ("Spray Arm Nut", 8.99, "Nut securing spray arm to mounting post", "Easy"),
+)
+
+# Dishwasher Pump Parts (8 parts)
+_DW_PUMP_PARTS = (
+    (
+        "Pump and Motor Assembly",
+        189.99,
+        "Complete pump assembly circulating and draining water",
+        "Difficult",
+    ),
+    ("Drain Pump", 78.99, "Pump removing waste water from dishwasher", "Moderate"),
+    (
+        "Circulation Pump",
+        142.99,
+        "Pump circulating water during wash cycle",
+        "Difficult",
+    ),
+    ("Pump Impeller", 24.99, "Rotating blade inside pump moving water", "Moderate"),
+    ("Pump Seal Kit", 18.99, "Seals preventing water leaks from pump", "Moderate"),
+    ("Drain Impeller", 16.99, "Impeller in drain pump removing water", "Moderate"),
+    (
+        "Pump Housing",
+        64.99,
+        "Housing containing pump motor and impeller",
+        "Difficult",
+    ),
+    (
+        "Chopper Blade",
+        19.99,
+        "Blade grinding food particles before draining",
+        "Easy",
+    ),
+)
+
+# Dishwasher Door Parts (8 parts)
+_DW_DOOR_PARTS = (
+    (
+        "Door Latch Assembly",
+        54.99,
+        "Latch keeping door closed and activating door switch",
+        "Moderate",
+    ),
+    ("Door Gasket", 41.99, "Seal preventing water leaks from door", "Easy"),
+    (
+        "Door Handle",
+        38.99,
+        "Handle for opening and closing dishwasher door",
+        "Easy",
+    ),
+    ("Door Hinge", 32.99, "Hinge allowing door to open and close", "Moderate"),
+    ("Door Spring", 22.99, "Spring assisting door opening and closing", "Moderate"),
+    ("Door Strike", 15.99, "Strike plate door latch engages with", "Easy"),
+    ("Door Cable", 28.99, "Cable connecting door to spring mechanism", "Moderate"),
+    (
+        "Door Balance Link Kit",
+        34.99,
+        "Kit balancing door weight for smooth operation",
+        "Moderate",
+    ),
+)
+
+# Dishwasher Heating Parts (6 parts)
+_DW_HEATING_PARTS = (
+    (
+        "Heating Element",
+        42.99,
+        "Element heating water during wash and drying dishes",
+        "Moderate",
+    ),
+    (
+        "High Limit Thermostat",
+        24.99,
+        "Safety thermostat preventing overheating",
+        "Moderate",
+    ),
+    (
+        "Thermal Fuse",
+        16.99,
+        "Fuse protecting heating element from overheating",
+        "Easy",
+    ),
+    (
+        "Heating Element Bracket",
+        12.99,
+        "Bracket securing heating element in place",
+        "Easy",
+    ),
+    (
+        "Rinse Aid Heater",
+        38.99,
+        "Small heater warming rinse aid dispenser",
+        "Moderate",
+    ),
+    (
+        "Drying Fan Assembly",
+        68.99,
+        "Fan circulating hot air for faster drying",
+        "Moderate",
+    ),
+)
+
+# Dishwasher Accessories Parts (8 parts)
+_DW_ACCESSORIES_PARTS = (
+    ("Silverware Basket", 18.99, "Basket holding utensils during wash", "Easy"),
+    ("Upper Dishrack", 89.99, "Complete upper rack assembly for dishes", "Easy"),
+    ("Lower Dishrack", 124.99, "Complete lower rack assembly for dishes", "Easy"),
+    ("Dishrack Roller", 12.99, "Wheel allowing rack to slide smoothly", "Easy"),
+    ("Rack Adjuster", 16.99, "Mechanism adjusting rack height", "Easy"),
+    ("Tine Row", 24.99, "Row of tines for holding dishes in place", "Easy"),
+    ("Cup Shelf", 28.99, "Flip-down shelf for cups and small items", "Easy"),
+    ("Cutlery Basket", 22.99, "Alternative basket design for utensils", "Easy"),
+)
+
+# Dishwasher Controls Parts (6 parts)
+_DW_CONTROLS_PARTS = (
+    (
+        "Control Board",
+        164.99,
+        "Main electronic control board managing all functions",
+        "Difficult",
+    ),
+    (
+        "User Interface Control",
+        128.99,
+        "Control panel with buttons and display",
+        "Moderate",
+    ),
+    ("Touchpad", 89.99, "Touch-sensitive control panel", "Moderate"),
+    ("Door Switch", 26.99, "Switch detecting if door is closed", "Easy"),
+    (
+        "Float Switch",
+        32.99,
+        "Switch preventing dishwasher from overfilling",
+        "Moderate",
+    ),
+    (
+        "Pressure Switch",
+        38.99,
+        "Switch detecting water level during cycle",
+        "Moderate",
+    ),
+)
+
+# Dishwasher Water System Parts (4 parts)
+_DW_WATER_PARTS = (
+    (
+        "Water Inlet Valve",
+        56.99,
+        "Valve controlling water flow into dishwasher",
+        "Moderate",
+    ),
+    ("Drain Hose", 22.99, "Hose carrying waste water to drain", "Moderate"),
+    ("Fill Hose", 18.99, "Hose carrying fresh water to tub", "Moderate"),
+    (
+        "Rinse Aid Dispenser",
+        28.99,
+        "Dispenser releasing rinse agent during cycle",
+        "Easy",
+    ),
+)
+
+# Image URL slug for every part name, computed once at import
+_SLUGS = {
+    name: name.lower().replace(" ", "-")
+    for group in (
+        _REFRIG_ICE_PARTS,
+        _REFRIG_WATER_PARTS,
+        _REFRIG_COOLING_PARTS,
+        _REFRIG_DOOR_PARTS,
+        _REFRIG_STORAGE_PARTS,
+        _REFRIG_LIGHTING_PARTS,
+        _REFRIG_CONTROLS_PARTS,
+        _DW_WASH_PARTS,
+        _DW_PUMP_PARTS,
+        _DW_DOOR_PARTS,
+        _DW_HEATING_PARTS,
+        _DW_ACCESSORIES_PARTS,
+        _DW_CONTROLS_PARTS,
+        _DW_WATER_PARTS,
+    )
+    for name, *_ in group
+}
+
+
+def _with_symptoms(items, symptoms, lead_symptom=None):
+    """Attach each part's symptoms to its row, computed once at import.
+
+    `lead_symptom`, when given, derives an extra name-specific symptom that is
+    listed before the shared ones.
+    """
+    return tuple(
+        (
+            name,
+            price,
+            desc,
+            diff,
+            (lead_symptom(name), *symptoms) if lead_symptom else symptoms,
         )
+        for name, price, desc, diff in items
+    )
 
-    # Water System Parts (4 parts)
-    water_system_parts = [
-        (
-            "Water Inlet Valve",
-            56.99,
-            "Valve controlling water flow into dishwasher",
-            "Moderate",
-        ),
-        ("Drain Hose", 22.99, "Hose carrying waste water to drain", "Moderate"),
-        ("Fill Hose", 18.99, "Hose carrying fresh water to tub", "Moderate"),
-        (
-            "Rinse Aid Dispenser",
-            28.99,
-            "Dispenser releasing rinse agent during cycle",
-            "Easy",
-        ),
-    ]
-
-    for name, price, desc, diff in water_system_parts:
-        parts.append(
-            {
-                "part_number": generate_part_number(),
-                "name": f"Dishwasher {name}",
-                "category": "Dishwasher",
-                "subcategory": "Water System",
-                "price": price,
-                "description": desc,
-                "compatible_models": select_dw_models(),
-                "brand": random.choice(brands),
-                "image_url": f"https://www.partselect.com/images/dw-{name.lower().replace(' ', '-')}.jpg",
-                "installation_difficulty": diff,
-                "installation_steps": [
-                    "Turn off power and water supply",
-                    "Remove lower access panel or pull dishwasher out",
-                    "Place towels to catch water",
-                    "Disconnect water line or hose",
-                    "Disconnect electrical connection if present",
-                    "Remove mounting brackets or clamps",
-                    "Remove old component",
-                    "Install new component with new clamps",
-                    "Reconnect water lines securely",
-                    "Reconnect electrical connections",
-                    "Turn on water slowly and check for leaks",
-                    "Restore power and test",
-                ],
-                "common_symptoms": [
-                    "Dishwasher won't fill with water",
-                    "Water leaking",
-                    "Spots on dishes",
-                    "Rinse aid not dispensing",
-                ],
-            }
+
+# Refrigerator groups as (subcategory, rows, installation steps)
+_REFRIG_GROUPS = (
+    (
+        "Ice Maker",
+        _with_symptoms(
+            _REFRIG_ICE_PARTS,
+            _REFRIG_ICE_SYMPTOMS,
+            lambda name: f"{name.split()[-1]} not working properly",
+        ),
+        _REFRIG_ICE_STEPS,
+    ),
+    (
+        "Water System",
+        _with_symptoms(_REFRIG_WATER_PARTS, _REFRIG_WATER_SYMPTOMS),
+        _REFRIG_WATER_STEPS,
+    ),
+    (
+        "Cooling System",
+        _with_symptoms(_REFRIG_COOLING_PARTS, _REFRIG_COOLING_SYMPTOMS),
+        _REFRIG_COOLING_STEPS,
+    ),
+    (
+        "Door Parts",
+        _with_symptoms(_REFRIG_DOOR_PARTS, _REFRIG_DOOR_SYMPTOMS),
+        _REFRIG_DOOR_STEPS,
+    ),
+    (
+        "Storage",
+        _with_symptoms(
+            _REFRIG_STORAGE_PARTS,
+            _REFRIG_STORAGE_SYMPTOMS,
+            lambda name: f"{name} broken or cracked",
+        ),
+        _REFRIG_STORAGE_STEPS,
+    ),
+    (
+        "Lighting",
+        _with_symptoms(_REFRIG_LIGHTING_PARTS, _REFRIG_LIGHTING_SYMPTOMS),
+        _REFRIG_LIGHTING_STEPS,
+    ),
+    (
+        "Controls",
+        _with_symptoms(_REFRIG_CONTROLS_PARTS, _REFRIG_CONTROLS_SYMPTOMS),
+        _REFRIG_CONTROLS_STEPS,
+    ),
+)
+
+# Dishwasher groups as (subcategory, rows, installation steps)
+_DW_GROUPS = (
+    (
+        "Wash System",
+        _with_symptoms(_DW_WASH_PARTS, _DW_WASH_SYMPTOMS),
+        _DW_WASH_STEPS,
+    ),
+    ("Pump", _with_symptoms(_DW_PUMP_PARTS, _DW_PUMP_SYMPTOMS), _DW_PUMP_STEPS),
+    (
+        "Door Parts",
+        _with_symptoms(_DW_DOOR_PARTS, _DW_DOOR_SYMPTOMS),
+        _DW_DOOR_STEPS,
+    ),
+    (
+        "Heating",
+        _with_symptoms(_DW_HEATING_PARTS, _DW_HEATING_SYMPTOMS),
+        _DW_HEATING_STEPS,
+    ),
+    (
+        "Accessories",
+        _with_symptoms(
+            _DW_ACCESSORIES_PARTS,
+            _DW_ACCESSORIES_SYMPTOMS,
+            lambda name: f"{name} broken or damaged",
+        ),
+        _DW_ACCESSORIES_STEPS,
+    ),
+    (
+        "Controls",
+        _with_symptoms(_DW_CONTROLS_PARTS, _DW_CONTROLS_SYMPTOMS),
+        _DW_CONTROLS_STEPS,
+    ),
+    (
+        "Water System",
+        _with_symptoms(_DW_WATER_PARTS, _DW_WATER_SYMPTOMS),
+        _DW_WATER_STEPS,
+    ),
+)
+
+# One entry per appliance; everything that differs between them lives here
+SPECS = (
+    {
+        "category": "Refrigerator",
+        "brands": _BRANDS_REFRIG,
+        "models": _MODELS_REFRIG,
+        "model_k": _REFRIG_K,
+        "img_base": _IMG_BASE,
+        "groups": _REFRIG_GROUPS,
+    },
+    {
+        "category": "Dishwasher",
+        "brands": _BRANDS_DW,
+        "models": _MODELS_DW,
+        "model_k": _DW_K,
+        "img_base": _IMG_BASE_DW,
+        "groups": _DW_GROUPS,
+    },
+)
+
+
+@dataclass(slots=True)
+class Part:
+    """One generated part; slots keep each record a compact fixed layout"""
+
+    part_number: str
+    name: str
+    category: str
+    subcategory: str
+    price: float
+    description: str
+    compatible_models: list
+    brand: str
+    image_url: str
+    installation_difficulty: str
+    installation_steps: tuple
+    common_symptoms: tuple
+
+
+def generate_part_numbers(count):
+    """Generate unique realistic part numbers (PS + 8 digits) in one batch"""
+    return [f"PS{n}" for n in random.sample(range(10000000, 100000000), count)]
+
+
+def select_models(models, k, n):
+    """Select k random compatible models for each of n parts in one pass"""
+    sample = random.sample
+    return [sample(models, k) for _ in range(n)]
+
+
+def _emit_parts(spec, group, picks):
+    """Build part records for one subcategory group.
+
+    `picks` yields a (part_number, brand, compatible_models) draw per part.
+    """
+    category = spec["category"]
+    img_base = spec["img_base"]
+    subcategory, rows, steps = group
+
+    # zip() pulls from rows first, so picks only advances once per row
+    for (name, price, desc, diff, symptoms), (part_number, brand, models) in zip(
+        rows, picks
+    ):
+        yield Part(
+            part_number=part_number,
+            name=f"{category} {name}",
+            category=category,
+            subcategory=subcategory,
+            price=price,
+            description=desc,
+            compatible_models=models,
+            brand=brand,
+            image_url=img_base + _SLUGS[name] + ".jpg",
+            installation_difficulty=diff,
+            installation_steps=steps,
+            common_symptoms=symptoms,
         )
 
-    return parts
+
+def iter_parts(spec):
+    """Yield every part for one appliance spec"""
+    groups = spec["groups"]
+
+    # Draw the random fields for the whole appliance in one batch each
+    n = sum(len(rows) for _, rows, _ in groups)
+    picks = zip(
+        generate_part_numbers(n),
+        random.choices(spec["brands"], k=n),
+        select_models(spec["models"], spec["model_k"], n),
+    )
+
+    for group in groups:
+        yield from _emit_parts(spec, group, picks)
 
 
 def main():
@@ -1048,38 +1063,43 @@ def main():
     print("Generating 100 PartSelect Parts...")
     print("=" * 50)
 
-    # Generate parts
-    refrigerator_parts = create_refrigerator_parts()
-    dishwasher_parts = create_dishwasher_parts()
+    from collections import Counter
+
+    # Stream records straight to disk as one JSON array, so no part list is
+    # ever held in memory; readers still see the same array of objects
+    output_file = "parts_data.json"
+    breakdown = {}
+    dumps = orjson.dumps
+
+    with open(output_file, "wb") as f:
+        f.write(b"[")
+        sep = b"\n"
+        for spec in SPECS:
+            subcats = breakdown[spec["category"]] = Counter()
+            for part in iter_parts(spec):
+                subcats[part.subcategory] += 1
+                f.write(sep)
+                f.write(dumps(part))
+                sep = b",\n"
+        f.write(b"\n]\n")
+        size = f.tell()
 
-    # Combine
-    all_parts = refrigerator_parts + dishwasher_parts
+    totals = {category: sum(c.values()) for category, c in breakdown.items()}
 
-    print(f"\n✅ Generated {len(all_parts)} parts:")
-    print(f"   - Refrigerator: {len(refrigerator_parts)} parts")
-    print(f"   - Dishwasher: {len(dishwasher_parts)} parts")
+    print(f"\n✅ Generated {sum(totals.values())} parts:")
+    for category, total in totals.items():
+        print(f"   - {category}: {total} parts")
 
     # Count by subcategory
     print("\n📊 Breakdown by subcategory:")
-    from collections import Counter
 
-    ref_subcats = Counter(p["subcategory"] for p in refrigerator_parts)
-    print("\n   Refrigerator:")
-    for subcat, count in sorted(ref_subcats.items()):
-        print(f"      - {subcat}: {count} parts")
-
-    dw_subcats = Counter(p["subcategory"] for p in dishwasher_parts)
-    print("\n   Dishwasher:")
-    for subcat, count in sorted(dw_subcats.items()):
-        print(f"      - {subcat}: {count} parts")
-
-    # Save to JSON
-    output_file = "parts_data.json"
-    with open(output_file, "w") as f:
-        json.dump(all_parts, f, indent=2)
+    for category, subcats in breakdown.items():
+        print(f"\n   {category}:")
+        for subcat, count in sorted(subcats.items()):
+            print(f"      - {subcat}: {count} parts")
 
     print(f"\n💾 Saved to: {output_file}")
-    print(f"📦 File size: {len(json.dumps(all_parts)) / 1024:.1f} KB")
+    print(f"📦 File size: {size / 1024:.1f} KB")
     print("\n✨ Done! Ready to import into your database.")
     print(f"\nNext steps:")
     print(f"1. Replace backend/parts_data.json with {output_file}")
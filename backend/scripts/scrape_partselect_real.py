@@ -3,43 +3,151 @@ PartSelect Real Data Scraper
 Extracts actual parts from PartSelect.com
 """
 
-import requests
-from bs4 import BeautifulSoup
-import json
-import time
+import asyncio
+import aiohttp
+from lxml import etree, html as lxml_html
+import orjson
 import re
-from typing import List, Dict
+from collections import Counter
+from typing import Callable, List, Dict
 import random
 
+# Detail pages in flight at once; each request still pauses briefly first
+CONCURRENCY = 8
+
+# Transient failures are retried with exponential backoff
+MAX_RETRIES = 3
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+BACKOFF_FACTOR = 0.5
+
+_PS_HREF_RE = re.compile(r"/PS\d+-")
+_PS_EXTRACT_RE = re.compile(r"/(PS\d+)-")
+_PRICE_VAL_RE = re.compile(r"\$?([\d,]+\.?\d*)")
+_MODEL_RE = re.compile(r"\b[A-Z]{2,}[A-Z0-9]{5,}\b")
+
+# (display name, lowercase) pairs for the case-insensitive brand search
+_BRANDS = tuple(
+    (brand, brand.lower())
+    for brand in (
+        "Whirlpool",
+        "GE",
+        "Samsung",
+        "LG",
+        "Frigidaire",
+        "KitchenAid",
+        "Kenmore",
+        "Maytag",
+        "Bosch",
+    )
+)
+
+# Earlier entries take priority, e.g. "water filter" is Water System
+_SUBCATEGORY_KEYWORDS = (
+    ("ice maker", "Ice Maker"),
+    ("water", "Water System"),
+    ("valve", "Water System"),
+    ("filter", "Filters"),
+    ("door", "Door Parts"),
+    ("gasket", "Door Parts"),
+    ("seal", "Door Parts"),
+    ("shelf", "Accessories"),
+    ("drawer", "Accessories"),
+    ("spray", "Wash System"),
+    ("pump", "Pump"),
+    ("motor", "Motors"),
+    ("fan", "Cooling System"),
+    ("heater", "Heating"),
+    ("thermostat", "Temperature Control"),
+    ("rack", "Accessories"),
+    ("basket", "Accessories"),
+    ("control", "Electronics"),
+    ("board", "Electronics"),
+)
+
+_EASY_RE = re.compile("filter|basket|rack|shelf|bin|tray")
+_DIFFICULT_RE = re.compile("compressor|motor|pump|board|control|evaporator")
+
+# XPath queries, compiled once and run directly on the lxml tree.
+# Class matching is a case-insensitive substring test.
+_CLASS_LC = (
+    "translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+)
+_HREF_XP = etree.XPath("//a/@href")
+_NAME_XPS = (
+    etree.XPath(
+        "(//h1[contains(concat(' ', normalize-space(@class), ' '), ' product-title ')])[1]"
+    ),
+    etree.XPath("(//h1)[1]"),
+    etree.XPath("(//title)[1]"),
+)
+_PRICE_XP = etree.XPath(f"(//span[contains({_CLASS_LC}, 'price')])[1]")
+_DESC_XP = etree.XPath(
+    f"(//div[contains({_CLASS_LC}, 'description') or contains({_CLASS_LC}, 'summary')])[1]"
+)
+_META_DESC_XP = etree.XPath("(//meta[@name='description'])[1]")
+_IMG_SRC_XP = etree.XPath(
+    f"(//img[contains({_CLASS_LC}, 'product') or contains({_CLASS_LC}, 'part')])[1]/@src"
+)
+_PAGE_TEXT_XP = etree.XPath("//text()[not(ancestor::script or ancestor::style)]")
+
+
+def _text(elem) -> str:
+    """Text of an element with each string stripped, like get_text(strip=True)"""
+    if len(elem) == 0:
+        # Leaf elements such as h1/title/span hold a single text node
+        return (elem.text or "").strip()
+    return "".join(t.strip() for t in elem.itertext())
+
 
 class PartSelectRealScraper:
-    def __init__(self):
+    def __init__(self, concurrency: int = CONCURRENCY):
         self.base_url = "https://www.partselect.com"
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.9",
         }
-        self.session = requests.Session()
-
-    def get_search_results(self, search_term: str, max_results: int = 15) -> List[str]:
+        self.concurrency = concurrency
+        self.timeout = aiohttp.ClientTimeout(total=15)
+        self.semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(self, session: aiohttp.ClientSession, url: str) -> bytes:
+        """Fetch a page body, keeping at most `concurrency` requests in flight"""
+        async with self.semaphore:
+            # Rate limiting - be respectful
+            await asyncio.sleep(random.uniform(0.2, 0.5))
+
+            for attempt in range(MAX_RETRIES + 1):
+                last_try = attempt == MAX_RETRIES
+                try:
+                    async with session.get(url, timeout=self.timeout) as response:
+                        if response.status not in RETRY_STATUSES or last_try:
+                            response.raise_for_status()
+                            return await response.read()
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                    if last_try:
+                        raise
+
+                await asyncio.sleep(BACKOFF_FACTOR * 2**attempt)
+
+    async def get_search_results(
+        self, session: aiohttp.ClientSession, search_term: str, max_results: int = 15
+    ) -> List[str]:
         """Get part numbers from search results"""
         url = f"{self.base_url}/ps-search.aspx?searchterm={search_term}"
         part_numbers = []
 
         try:
             print(f"  Searching for: {search_term}")
-            response = self.session.get(url, headers=self.headers, timeout=15)
-            response.raise_for_status()
+            content = await self.fetch(session, url)
 
-            soup = BeautifulSoup(response.content, "html.parser")
+            root = lxml_html.fromstring(content)
 
             # Find part number links
-            links = soup.find_all("a", href=re.compile(r"/PS\d+-"))
+            links = [href for href in _HREF_XP(root) if _PS_HREF_RE.search(href)]
 
-            for link in links[:max_results]:
-                href = link.get("href", "")
-                match = re.search(r"/(PS\d+)-", href)
+            for href in links[:max_results]:
+                match = _PS_EXTRACT_RE.search(href)
                 if match:
                     part_num = match.group(1)
                     if part_num not in part_numbers:
@@ -52,23 +160,33 @@ class PartSelectRealScraper:
 
         return part_numbers
 
-    def scrape_part_details(self, part_number: str, category: str) -> Dict:
+    async def scrape_part_details(
+        self, session: aiohttp.ClientSession, part_number: str, category: str
+    ) -> Dict:
         """Scrape details for a specific part"""
         url = f"{self.base_url}/{part_number}-parts.html"
 
         try:
-            response = self.session.get(url, headers=self.headers, timeout=15)
-            response.raise_for_status()
+            content = await self.fetch(session, url)
 
-            soup = BeautifulSoup(response.content, "html.parser")
+            root = lxml_html.fromstring(content)
 
             # Extract information
-            name = self.extract_name(soup, part_number)
-            price = self.extract_price(soup)
-            description = self.extract_description(soup)
-            brand = self.extract_brand(soup)
-            image = self.extract_image(soup)
-            models = self.extract_models(soup)
+            name = self.extract_name(root, part_number)
+            if name == f"Part {part_number}":
+                # No heading or title at all: a blocked or empty page, so
+                # skip the remaining extraction passes
+                print(f"    ✗ {part_number}: no part details on page")
+                return None
+
+            # Brand and model extraction both search this one text pass
+            page_text = "".join(_PAGE_TEXT_XP(root))
+
+            price = self.extract_price(root)
+            description = self.extract_description(root)
+            brand = self.extract_brand(page_text)
+            image = self.extract_image(root)
+            models = self.extract_models(page_text)
 
             part_data = {
                 "part_number": part_number,
@@ -92,74 +210,133 @@ class PartSelectRealScraper:
             print(f"    ✗ Error scraping {part_number}: {e}")
             return None
 
-    def extract_name(self, soup: BeautifulSoup, part_number: str) -> str:
+    async def scrape_search(
+        self,
+        session: aiohttp.ClientSession,
+        category: str,
+        search_term: str,
+        max_results: int,
+        on_part: Callable[[Dict], None],
+    ):
+        """Scrape every part found by one search, fetching details concurrently.
+
+        Each part is handed to `on_part` as soon as its page is parsed.
+        """
+        part_numbers = await self.get_search_results(
+            session, search_term, max_results=max_results
+        )
+
+        for task in asyncio.as_completed(
+            [
+                self.scrape_part_details(session, part_num, category)
+                for part_num in part_numbers[:max_results]
+            ]
+        ):
+            part_data = await task
+            if part_data:
+                on_part(part_data)
+
+    async def scrape_all(
+        self, searches: Dict[str, List[str]], parts_per_search: int, filename: str
+    ) -> Counter:
+        """Run all searches over one shared connection pool, streaming parts
+        to `filename` as a JSON array. Returns the part count per category.
+        """
+        counts = Counter()
+
+        with open(filename, "wb") as f:
+            # Each part is written and flushed as it arrives, so an
+            # interrupted scrape keeps everything collected so far
+            sep = b"[\n"
+
+            def write_part(part_data: Dict):
+                nonlocal sep
+                if f.closed:
+                    # A search still running after the scrape was aborted
+                    return
+                f.write(sep)
+                f.write(orjson.dumps(part_data, option=orjson.OPT_INDENT_2))
+                f.flush()
+                sep = b",\n"
+                counts[part_data["category"]] += 1
+
+            try:
+                # Keep-alive pool sized to the concurrency limit, with DNS
+                # cached, so repeat requests reuse warm TLS connections
+                connector = aiohttp.TCPConnector(
+                    limit=self.concurrency, ttl_dns_cache=300
+                )
+                async with aiohttp.ClientSession(
+                    headers=self.headers, connector=connector
+                ) as session:
+                    await asyncio.gather(
+                        *(
+                            self.scrape_search(
+                                session, category, search, parts_per_search, write_part
+                            )
+                            for category, search_terms in searches.items()
+                            for search in search_terms
+                        )
+                    )
+            finally:
+                # Close the array even on Ctrl-C or an error, so the parts
+                # written so far still load as valid JSON
+                f.write(b"\n]\n" if sep == b",\n" else b"[]\n")
+
+        return counts
+
+    def extract_name(self, root: lxml_html.HtmlElement, part_number: str) -> str:
         """Extract part name"""
         # Try multiple selectors
-        name_elem = (
-            soup.find("h1", class_="product-title")
-            or soup.find("h1")
-            or soup.find("title")
-        )
+        name_elem = next((found[0] for xp in _NAME_XPS if (found := xp(root))), None)
 
-        if name_elem:
-            text = name_elem.get_text(strip=True)
+        if name_elem is not None:
+            text = _text(name_elem)
             # Clean up the name
             text = text.replace(part_number, "").replace("-", "").strip()
             return text[:100]  # Limit length
 
         return f"Part {part_number}"
 
-    def extract_price(self, soup: BeautifulSoup) -> float:
+    def extract_price(self, root: lxml_html.HtmlElement) -> float:
         """Extract price"""
-        price_elem = soup.find("span", class_=re.compile("price", re.I))
+        price_elem = _PRICE_XP(root)
         if price_elem:
-            text = price_elem.get_text(strip=True)
-            match = re.search(r"\$?([\d,]+\.?\d*)", text)
+            text = _text(price_elem[0])
+            match = _PRICE_VAL_RE.search(text)
             if match:
                 return float(match.group(1).replace(",", ""))
 
         # Default price
         return round(random.uniform(25, 180), 2)
 
-    def extract_description(self, soup: BeautifulSoup) -> str:
+    def extract_description(self, root: lxml_html.HtmlElement) -> str:
         """Extract description"""
-        desc_elem = soup.find("div", class_=re.compile("description|summary", re.I))
+        desc_elem = _DESC_XP(root)
         if desc_elem:
-            return desc_elem.get_text(strip=True)[:500]
+            return _text(desc_elem[0])[:500]
 
         # Try meta description
-        meta = soup.find("meta", {"name": "description"})
+        meta = _META_DESC_XP(root)
         if meta:
-            return meta.get("content", "")[:500]
+            return meta[0].get("content", "")[:500]
 
         return "Replacement appliance part."
 
-    def extract_brand(self, soup: BeautifulSoup) -> str:
+    def extract_brand(self, page_text: str) -> str:
         """Extract brand"""
-        brands = [
-            "Whirlpool",
-            "GE",
-            "Samsung",
-            "LG",
-            "Frigidaire",
-            "KitchenAid",
-            "Kenmore",
-            "Maytag",
-            "Bosch",
-        ]
-        text = soup.get_text().lower()
-
-        for brand in brands:
-            if brand.lower() in text:
+        text = page_text.lower()
+
+        for brand, brand_lower in _BRANDS:
+            if brand_lower in text:
                 return brand
 
         return "Whirlpool"
 
-    def extract_image(self, soup: BeautifulSoup) -> str:
+    def extract_image(self, root: lxml_html.HtmlElement) -> str:
         """Extract image URL"""
-        img = soup.find("img", class_=re.compile("product|part", re.I))
-        if img and img.get("src"):
-            src = img["src"]
+        src = next(iter(_IMG_SRC_XP(root)), None)
+        if src:
             if src.startswith("//"):
                 return "https:" + src
             elif src.startswith("/"):
@@ -167,21 +344,18 @@ class PartSelectRealScraper:
             return src
         return None
 
-    def extract_models(self, soup: BeautifulSoup) -> List[str]:
+    def extract_models(self, page_text: str) -> List[str]:
         """Extract compatible model numbers"""
         models = []
 
-        # Look for model numbers in page
-        text = soup.get_text()
-        model_matches = re.findall(r"\b[A-Z]{2,}[A-Z0-9]{5,}\b", text)
-
-        # Clean and deduplicate
+        # Look for model numbers in page, deduplicating as we go and
+        # stopping at the fifth instead of collecting every match first
         seen = set()
-        for model in model_matches:
-            if len(model) >= 7 and len(model) <= 15:
-                if model not in seen:
-                    models.append(model)
-                    seen.add(model)
+        for match in _MODEL_RE.finditer(page_text):
+            model = match.group(0)
+            if 7 <= len(model) <= 15 and model not in seen:
+                seen.add(model)
+                models.append(model)
                 if len(models) >= 5:
                     break
 
@@ -199,29 +373,7 @@ class PartSelectRealScraper:
         """Infer subcategory from part name"""
         name_lower = name.lower()
 
-        subcats = {
-            "ice maker": "Ice Maker",
-            "water": "Water System",
-            "valve": "Water System",
-            "filter": "Filters",
-            "door": "Door Parts",
-            "gasket": "Door Parts",
-            "seal": "Door Parts",
-            "shelf": "Accessories",
-            "drawer": "Accessories",
-            "spray": "Wash System",
-            "pump": "Pump",
-            "motor": "Motors",
-            "fan": "Cooling System",
-            "heater": "Heating",
-            "thermostat": "Temperature Control",
-            "rack": "Accessories",
-            "basket": "Accessories",
-            "control": "Electronics",
-            "board": "Electronics",
-        }
-
-        for keyword, subcat in subcats.items():
+        for keyword, subcat in _SUBCATEGORY_KEYWORDS:
             if keyword in name_lower:
                 return subcat
 
@@ -231,19 +383,9 @@ class PartSelectRealScraper:
         """Infer installation difficulty"""
         name_lower = name.lower()
 
-        easy_keywords = ["filter", "basket", "rack", "shelf", "bin", "tray"]
-        difficult_keywords = [
-            "compressor",
-            "motor",
-            "pump",
-            "board",
-            "control",
-            "evaporator",
-        ]
-
-        if any(k in name_lower for k in easy_keywords):
+        if _EASY_RE.search(name_lower):
             return "Easy"
-        elif any(k in name_lower for k in difficult_keywords):
+        elif _DIFFICULT_RE.search(name_lower):
             return "Difficult"
         else:
             return "Moderate"
@@ -319,12 +461,6 @@ class PartSelectRealScraper:
 
         return symptoms[:3]
 
-    def save_to_json(self, parts: List[Dict], filename: str):
-        """Save to JSON file"""
-        with open(filename, "w") as f:
-            json.dump(parts, indent=2, fp=f)
-        print(f"\n✓ Saved {len(parts)} parts to {filename}")
-
 
 def main():
     print("=" * 80)
@@ -351,51 +487,27 @@ def main():
         ],
     }
 
-    all_parts = []
     parts_per_search = 6  # Limit to avoid overload
 
-    for category, search_terms in searches.items():
-        print(f"\n{'='*80}")
-        print(f"Category: {category}")
-        print(f"{'='*80}")
-
-        for search in search_terms:
-            print(f"\n{search}:")
-
-            # Get part numbers
-            part_numbers = scraper.get_search_results(
-                search, max_results=parts_per_search
-            )
+    total_searches = sum(len(terms) for terms in searches.values())
+    print(f"\nRunning {total_searches} searches, {CONCURRENCY} requests at a time")
 
-            # Scrape each part
-            for part_num in part_numbers[:parts_per_search]:
-                part_data = scraper.scrape_part_details(part_num, category)
-
-                if part_data:
-                    all_parts.append(part_data)
-
-                # Rate limiting - be respectful
-                time.sleep(random.uniform(2, 4))
-
-            # Longer pause between searches
-            time.sleep(random.uniform(3, 5))
+    output_file = "parts_data_real.json"
+    counts = asyncio.run(scraper.scrape_all(searches, parts_per_search, output_file))
+    total = sum(counts.values())
 
     print(f"\n{'='*80}")
     print(f"✓ SCRAPING COMPLETE!")
-    print(f"✓ Total parts collected: {len(all_parts)}")
+    print(f"✓ Total parts collected: {total}")
     print(f"{'='*80}")
 
-    # Save
-    scraper.save_to_json(all_parts, "parts_data_real.json")
+    print(f"\n✓ Saved {total} parts to {output_file}")
 
     # Show summary
-    fridge_count = sum(1 for p in all_parts if p["category"] == "Refrigerator")
-    dish_count = sum(1 for p in all_parts if p["category"] == "Dishwasher")
-
     print(f"\nSummary:")
-    print(f"  - Refrigerator parts: {fridge_count}")
-    print(f"  - Dishwasher parts: {dish_count}")
-    print(f"  - Total: {len(all_parts)}")
+    print(f"  - Refrigerator parts: {counts['Refrigerator']}")
+    print(f"  - Dishwasher parts: {counts['Dishwasher']}")
+    print(f"  - Total: {total}")
 
 
 if __name__ == "__main__":
@@ -1,431 +0,0 @@
-"""
-PartSelect Selenium Scraper - Enhanced Version
-"""
-
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
-import json
-import time
-import random
-import re
-from typing import List, Dict
-
-
-class SeleniumPartSelectScraper:
-    def __init__(self, headless: bool = False):
-        """Initialize Selenium scraper"""
-        print("Initializing Chrome browser...")
-
-        chrome_options = Options()
-        if headless:
-            chrome_options.add_argument("--headless")
-
-        # Anti-detection measures
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_argument(
-            "--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option("useAutomationExtension", False)
-
-        # Initialize driver
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        self.driver.implicitly_wait(10)
-
-        print("✓ Browser initialized!")
-
-        self.base_url = "https://www.partselect.com"
-        self.scraped_part_numbers = set()  # Track scraped parts
-
-    def human_delay(self, min_sec: float = 2, max_sec: float = 5):
-        """Random delay to mimic human behavior"""
-        time.sleep(random.uniform(min_sec, max_sec))
-
-    def get_parts_from_url(
-        self, category_name: str, url: str, max_parts: int = 10
-    ) -> List[Dict]:
-        """Navigate to URL and extract parts"""
-        parts = []
-
-        try:
-            print(f"\nFetching: {url}")
-            self.driver.get(url)
-            self.human_delay(3, 5)
-
-            soup = BeautifulSoup(self.driver.page_source, "html.parser")
-
-            # Find part links
-            part_links = soup.find_all("a", href=re.compile(r"/PS\d+"))
-
-            # Extract unique part numbers
-            part_numbers = []
-            for link in part_links:
-                href = link.get("href", "")
-                match = re.search(r"/(PS\d+)", href)
-                if match:
-                    part_num = match.group(1)
-                    # Only add if we haven't scraped it yet
-                    if (
-                        part_num not in self.scraped_part_numbers
-                        and part_num not in part_numbers
-                    ):
-                        part_numbers.append(part_num)
-
-            print(f"  Found {len(part_numbers)} new parts")
-
-            # Scrape each part
-            for i, part_num in enumerate(part_numbers[:max_parts]):
-                if len(parts) >= max_parts:
-                    break
-
-                print(
-                    f"  [{i+1}/{min(len(part_numbers), max_parts)}] {part_num}...",
-                    end=" ",
-                )
-
-                part_data = self.scrape_part_page(part_num, category_name)
-
-                if part_data:
-                    parts.append(part_data)
-                    self.scraped_part_numbers.add(part_num)
-                    print(f"✓ ${part_data['price']}")
-                else:
-                    print("✗")
-
-                self.human_delay(2, 4)
-
-        except Exception as e:
-            print(f"  Error: {e}")
-
-        return parts
-
-    def scrape_part_page(self, part_number: str, category: str) -> Dict:
-        """Scrape individual part page"""
-        url = f"{self.base_url}/{part_number}-parts.html"
-
-        try:
-            self.driver.get(url)
-            self.human_delay(2, 3)
-
-            soup = BeautifulSoup(self.driver.page_source, "html.parser")
-
-            # Extract data
-            name = self.extract_name(soup, part_number)
-            price = self.extract_price(soup)
-            description = self.extract_description(soup)
-            brand = self.extract_brand(soup, category)
-            image = self.extract_image(soup)
-            models = self.extract_models(soup)
-            symptoms = self.extract_symptoms(soup)
-
-            part_data = {
-                "part_number": part_number,
-                "name": name,
-                "category": category,
-                "subcategory": self.infer_subcategory(name),
-                "price": price,
-                "description": description,
-                "brand": brand,
-                "image_url": image,
-                "installation_difficulty": self.infer_difficulty(name),
-                "installation_steps": self.generate_steps(name),
-                "common_symptoms": (
-                    symptoms
-                    if symptoms
-                    else self.generate_default_symptoms(name, category)
-                ),
-                "compatible_models": models[:5] if models else self.generate_models(),
-            }
-
-            return part_data
-
-        except Exception as e:
-            return None
-
-    def extract_name(self, soup: BeautifulSoup, part_number: str) -> str:
-        """Extract part name"""
-        selectors = [
-            ("h1", {"itemprop": "name"}),
-            ("h1", {}),
-            ("span", {"class": "pdp-title"}),
-        ]
-
-        for tag, attrs in selectors:
-            elem = soup.find(tag, attrs)
-            if elem:
-                text = elem.get_text(strip=True)
-                text = text.replace(part_number, "").replace("  ", " ").strip()
-                if text:
-                    return text[:150]
-
-        return f"Appliance Part {part_number}"
-
-    def extract_price(self, soup: BeautifulSoup) -> float:
-        """Extract price"""
-        price_selectors = [
-            ("span", {"itemprop": "price"}),
-            ("span", {"class": re.compile("price", re.I)}),
-        ]
-
-        for tag, attrs in price_selectors:
-            elem = soup.find(tag, attrs)
-            if elem:
-                text = elem.get_text(strip=True)
-                match = re.search(r"\$?([\d,]+\.?\d*)", text)
-                if match:
-                    return float(match.group(1).replace(",", ""))
-
-        return round(random.uniform(25, 180), 2)
-
-    def extract_description(self, soup: BeautifulSoup) -> str:
-        """Extract description"""
-        meta = soup.find("meta", {"name": "description"})
-        if meta:
-            desc = meta.get("content", "")
-            if len(desc) > 50:
-                return desc[:500]
-
-        desc_div = soup.find("div", {"class": re.compile("description|summary", re.I)})
-        if desc_div:
-            return desc_div.get_text(strip=True)[:500]
-
-        return "Genuine OEM replacement part for your appliance."
-
-    def extract_brand(self, soup: BeautifulSoup, category: str) -> str:
-        """Extract brand"""
-        brands = [
-            "Whirlpool",
-            "GE",
-            "Samsung",
-            "LG",
-            "Frigidaire",
-            "KitchenAid",
-            "Kenmore",
-            "Maytag",
-            "Bosch",
-        ]
-        text = soup.get_text().lower()
-
-        for brand in brands:
-            if brand.lower() in text:
-                return brand
-
-        return "Whirlpool"
-
-    def extract_image(self, soup: BeautifulSoup) -> str:
-        """Extract image"""
-        img = soup.find("img", {"itemprop": "image"})
-        if not img:
-            img = soup.find("img", {"class": re.compile("product|part", re.I)})
-
-        if img and img.get("src"):
-            src = img["src"]
-            if src.startswith("//"):
-                return "https:" + src
-            elif src.startswith("/"):
-                return self.base_url + src
-            return src
-
-        return None
-
-    def extract_models(self, soup: BeautifulSoup) -> List[str]:
-        """Extract compatible models"""
-        models = []
-        text = soup.get_text()
-        found = re.findall(r"\b[A-Z]{2,}[A-Z0-9]{5,}\b", text)
-        models = list(set(found))[:5]
-        return models
-
-    def extract_symptoms(self, soup: BeautifulSoup) -> List[str]:
-        """Extract symptoms"""
-        symptoms = []
-        symptom_section = soup.find("div", string=re.compile("symptom|fix", re.I))
-        if symptom_section:
-            parent = symptom_section.find_parent("div")
-            if parent:
-                items = parent.find_all(["li", "span"])
-                symptoms = [item.get_text(strip=True) for item in items[:5]]
-
-        return [s for s in symptoms if len(s) > 5][:3]
-
-    def generate_models(self) -> List[str]:
-        """Generate model numbers"""
-        prefixes = ["WDT", "WRF", "KDFE", "GSS", "LFX", "WDF", "MFI", "KSF"]
-        models = []
-        for i in range(3):
-            models.append(
-                f"{random.choice(prefixes)}{random.randint(100,999)}{random.choice(['A','S','X'])}EM{random.randint(0,9)}"
-            )
-        return models
-
-    def generate_default_symptoms(self, name: str, category: str) -> List[str]:
-        """Generate default symptoms"""
-        name_lower = name.lower()
-
-        if "ice" in name_lower:
-            return ["Ice maker not working", "No ice production", "Ice maker leaking"]
-        elif "water" in name_lower:
-            return ["Water not dispensing", "Water leaking", "No water flow"]
-        elif "door" in name_lower or "gasket" in name_lower:
-            return ["Door not sealing", "Warm temperature", "Frost buildup"]
-        elif "pump" in name_lower:
-            return ["Not draining", "Water in bottom", "Loud noise"]
-        elif "spray" in name_lower:
-            return ["Dishes not clean", "Poor wash performance"]
-        elif "heat" in name_lower or "element" in name_lower:
-            return ["Dishes not drying", "Not heating", "Cold water"]
-        else:
-            return [
-                f"{category} not working properly",
-                "Performance issues",
-                "Unusual noise",
-            ]
-
-    def infer_subcategory(self, name: str) -> str:
-        """Infer subcategory"""
-        name_lower = name.lower()
-        mapping = {
-            "ice": "Ice Maker",
-            "water": "Water System",
-            "door": "Door Parts",
-            "gasket": "Door Parts",
-            "shelf": "Accessories",
-            "drawer": "Accessories",
-            "bin": "Accessories",
-            "spray": "Wash System",
-            "pump": "Pump",
-            "motor": "Motors",
-            "fan": "Cooling System",
-            "heater": "Heating",
-            "element": "Heating",
-            "rack": "Accessories",
-            "basket": "Accessories",
-            "wheel": "Accessories",
-            "latch": "Door Parts",
-            "control": "Electronics",
-        }
-
-        for keyword, subcat in mapping.items():
-            if keyword in name_lower:
-                return subcat
-        return "Parts"
-
-    def infer_difficulty(self, name: str) -> str:
-        """Infer difficulty"""
-        name_lower = name.lower()
-        if any(
-            k in name_lower
-            for k in ["filter", "basket", "rack", "shelf", "bin", "wheel"]
-        ):
-            return "Easy"
-        elif any(
-            k in name_lower for k in ["compressor", "motor", "pump", "control", "board"]
-        ):
-            return "Difficult"
-        else:
-            return "Moderate"
-
-    def generate_steps(self, name: str) -> List[str]:
-        """Generate steps"""
-        difficulty = self.infer_difficulty(name)
-
-        if difficulty == "Easy":
-            return [
-                "Disconnect power",
-                "Remove old part",
-                "Install new part",
-                "Test operation",
-            ]
-        elif difficulty == "Difficult":
-            return [
-                "Disconnect power and water",
-                "Remove panels",
-                "Disconnect connections",
-                "Remove old component",
-                "Install new part",
-                "Reconnect everything",
-                "Test thoroughly",
-            ]
-        else:
-            return [
-                "Turn off power",
-                "Access part location",
-                "Disconnect connections",
-                "Remove old part",
-                "Install new part",
-                "Reconnect and test",
-            ]
-
-    def save_to_json(self, parts: List[Dict], filename: str):
-        """Save to JSON"""
-        with open(filename, "w") as f:
-            json.dump(parts, indent=2, fp=f)
-        print(f"\n✓ Saved {len(parts)} parts to {filename}")
-
-    def close(self):
-        """Close browser"""
-        print("\nClosing browser...")
-        self.driver.quit()
-
-
-def main():
-    print("=" * 80)
-    print("PartSelect Enhanced Scraper - Getting 50+ Parts")
-    print("=" * 80)
-
-    scraper = SeleniumPartSelectScraper(headless=False)
-
-    try:
-        # Multiple URLs to scrape more parts
-        urls_to_scrape = [
-            # Refrigerator categories
-            ("Refrigerator", "https://www.partselect.com/Refrigerator-Parts.htm", 10),
-            ("Refrigerator", "https://www.partselect.com/Ice-Makers.htm", 10),
-            ("Refrigerator", "https://www.partselect.com/Water-Filters.htm", 5),
-            ("Refrigerator", "https://www.partselect.com/Door-Parts.htm", 5),
-            # Dishwasher categories
-            ("Dishwasher", "https://www.partselect.com/Dishwasher-Parts.htm", 10),
-            ("Dishwasher", "https://www.partselect.com/Dishwasher-Racks.htm", 10),
-            ("Dishwasher", "https://www.partselect.com/Spray-Arms.htm", 5),
-        ]
-
-        all_parts = []
-
-        for category, url, max_parts in urls_to_scrape:
-            print(f"\n{'='*80}")
-            print(f"Category: {category} | Target: {max_parts} parts")
-            print(f"{'='*80}")
-
-            parts = scraper.get_parts_from_url(category, url, max_parts)
-            all_parts.extend(parts)
-
-            print(f"✓ Collected {len(parts)} parts | Total so far: {len(all_parts)}")
-
-        print(f"\n{'='*80}")
-        print(f"✓ SCRAPING COMPLETE!")
-        print(f"✓ Total parts: {len(all_parts)}")
-        print(f"{'='*80}")
-
-        scraper.save_to_json(all_parts, "parts_data_real.json")
-
-        # Summary
-        fridge = sum(1 for p in all_parts if p["category"] == "Refrigerator")
-        dish = sum(1 for p in all_parts if p["category"] == "Dishwasher")
-
-        print(f"\nBreakdown:")
-        print(f"  - Refrigerator: {fridge} parts")
-        print(f"  - Dishwasher: {dish} parts")
-
-    finally:
-        scraper.close()
-
-
-if __name__ == "__main__":
-    main()
@@ -5,10 +5,44 @@ Using sentence-transformers (FREE - no API key needed!)
 
 import chromadb
 from chromadb.config import Settings
+import functools
 import json
-from typing import List, Dict
+import numpy as np
+from typing import List, Dict, Union
 from sentence_transformers import SentenceTransformer
 import os
+import sys
+
+
+def _pick_device() -> str:
+    """EMBEDDING_DEVICE if set, else CUDA, then Apple MPS, then CPU"""
+    device = os.getenv("EMBEDDING_DEVICE")
+    if device:
+        return device
+
+    import torch
+
+    if torch.cuda.is_available():
+        return "cuda"
+    if torch.backends.mps.is_available():
+        return "mps"
+    return "cpu"
+
+
+@functools.lru_cache(maxsize=1)
+def _load_embedder(name: str = "all-MiniLM-L6-v2") -> SentenceTransformer:
+    """Load the embedding model once per process; every VectorStore shares it"""
+    device = _pick_device()
+    print(
+        f"Loading embedding model on {device}... "
+        "(this may take a moment on first run)"
+    )
+    model = SentenceTransformer(name, device=device)
+    # Part texts and queries are short; capping below the model's 256-token
+    # default keeps padded batches, and so attention cost, small
+    model.max_seq_length = 128
+    print("Embedding model loaded successfully!")
+    return model
 
 
 class VectorStore:
@@ -39,19 +73,20 @@ class VectorStore:
             metadata={"description": "PartSelect parts embeddings"},
         )
 
-        # Load sentence transformer model
-        print("Loading embedding model... (this may take a moment on first run)")
-        self.embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
-        print("Embedding model loaded successfully!")
+        # Load sentence transformer model (shared across instances)
+        self.embedding_model = _load_embedder()
 
         # Check existing data
         count = self.collection.count()
         print(f"Vector store has {count} documents")
 
-    def generate_embedding(self, text: str) -> List[float]:
-        """Generate embedding using local sentence-transformers model"""
-        embedding = self.embedding_model.encode(text, convert_to_tensor=False)
-        return embedding.tolist()
+    def generate_embedding(self, text: Union[str, List[str]]) -> np.ndarray:
+        """Generate embedding using local sentence-transformers model.
+
+        Pass a list of texts to embed them in one batch. Returns the raw
+        array; convert with .tolist() only where Chroma needs lists.
+        """
+        return self.embedding_model.encode(text, convert_to_numpy=True)
 
     def add_parts(self, parts: List[Dict]):
         """Add parts to vector database"""
@@ -62,11 +97,8 @@ class VectorStore:
         documents = []
         metadatas = []
         ids = []
-        embeddings = []
-
-        print(f"Generating embeddings for {len(parts)} parts...")
 
-        for idx, part in enumerate(parts):
+        for part in parts:
             # Create rich text representation for embedding
             text = f"""
             Part: {part['name']}
@@ -90,20 +122,25 @@ class VectorStore:
             )
             ids.append(part["part_number"])
 
-            # Generate embedding
-            embedding = self.generate_embedding(text)
-            embeddings.append(embedding)
-
-            # Progress indicator
-            if (idx + 1) % 2 == 0 or (idx + 1) == len(parts):
-                print(f"Processed {idx + 1}/{len(parts)} parts...")
+        # Encode all documents in batches rather than one forward pass per part
+        print(f"Generating embeddings for {len(parts)} parts...")
+        embeddings = self.embedding_model.encode(
+            documents, batch_size=64, convert_to_numpy=True, show_progress_bar=True
+        )
 
         # Add to collection
         try:
-            self.collection.add(
-                documents=documents, metadatas=metadatas, ids=ids, embeddings=embeddings
+            # Upsert keyed on part number updates existing rows in place, so
+            # reloading parts doesn't require rebuilding the index.
+            # chromadb 0.4 validates embeddings as lists, so convert the
+            # whole (N, dim) array in one call at the boundary
+            self.collection.upsert(
+                documents=documents,
+                metadatas=metadatas,
+                ids=ids,
+                embeddings=embeddings.tolist(),
             )
-            print(f"✓ Successfully added {len(parts)} parts to vector database!")
+            print(f"✓ Successfully upserted {len(parts)} parts to vector database!")
             print(f"✓ Total documents in collection: {self.collection.count()}")
 
             # Verify persistence
@@ -134,7 +171,7 @@ class VectorStore:
         # Search
         try:
             results = self.collection.query(
-                query_embeddings=[query_embedding],
+                query_embeddings=query_embedding.reshape(1, -1).tolist(),
                 n_results=min(n_results, count),
                 where=where_filter,
             )
@@ -163,8 +200,12 @@ class VectorStore:
             print(f"Error clearing collection: {e}")
 
 
-def initialize_vector_store():
-    """Initialize vector store with parts data"""
+def initialize_vector_store(rebuild: bool = False):
+    """Initialize vector store with parts data.
+
+    Parts are upserted into the existing collection; pass `rebuild=True`
+    (or --rebuild on the command line) to drop and recreate it first.
+    """
     # Load parts data
     parts_file = os.path.join(
         os.path.dirname(os.path.dirname(__file__)), "parts_data.json"
@@ -186,8 +227,9 @@ def initialize_vector_store():
     db_path = os.path.abspath("./chroma_db")
     vs = VectorStore(db_path=db_path)
 
-    # Clear existing data
-    vs.clear_collection()
+    # Only start from an empty collection when asked to
+    if rebuild:
+        vs.clear_collection()
 
     # Add parts
     vs.add_parts(parts)
@@ -227,4 +269,4 @@ def initialize_vector_store():
 
 
 if __name__ == "__main__":
-    initialize_vector_store()
+    initialize_vector_store(rebuild="--rebuild" in sys.argv)